@@ -11,46 +11,394 @@ Topic: docker_monitor.mcp
 
 Requires: pip install docker
 Requires: Docker daemon running
+Optional: pip install uvloop (faster event loop)
 """
 
 import asyncio
-import argparse
+import atexit
 import json
+import os
+import platform
+import threading
+import time
+from typing import TYPE_CHECKING
 
-import docker
 from mcp.server.fastmcp import FastMCP
 
 from agntcy_app_sdk.factory import AgntcyFactory
 
+if TYPE_CHECKING:
+    import docker
+
 factory = AgntcyFactory(enable_tracing=False)
 
 
-def _get_docker_client():
-    """Create a Docker client from the local environment."""
-    return docker.from_env()
+# Upper bound on a single container's stats sample when fanning out across
+# all containers, so one unresponsive container cannot stall the batch.
+STATS_TIMEOUT_SECONDS = 2.0
+
+# Interval between the two cgroup CPU reads taken the first time a container
+# is sampled, when there is no earlier read to measure against.
+CGROUP_CPU_SAMPLE_SECONDS = 0.1
+
+_CGROUP_ROOT = "/sys/fs/cgroup"
+
+# When dockerd runs on this kernel and its container cgroups are visible,
+# usage can be read straight from cgroupfs instead of round-tripping through
+# dockerd -> containerd.  Inside a container (private cgroup namespace) and on
+# Docker Desktop / linuxkit hosts the streaming StatsCache is used instead.
+_USE_CGROUPS = platform.system() == "Linux" and any(
+    os.path.isdir(f"{_CGROUP_ROOT}/{parent}")
+    for parent in ("system.slice", "docker", "cpuacct/docker")
+)
+
+# Host CPU count and memory size, read once at import instead of per sample.
+_HOST_CPUS = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else os.cpu_count() or 1
+)
+_HOST_MEMORY_BYTES = (
+    os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    if hasattr(os, "sysconf")
+    else 0
+)
+
+# container id -> (cumulative CPU ns, monotonic ns) of the previous cgroup read
+_cgroup_prev_cpu: dict[str, tuple[int, int]] = {}
+
+
+_docker_client: "docker.DockerClient | None" = None
+
+
+def _get_docker_client() -> "docker.DockerClient":
+    """Return the process-wide Docker client, creating it on first use.
+
+    Reusing one client keeps a single pooled connection to dockerd instead
+    of opening and tearing down a socket per tool call.
+    """
+    global _docker_client
+    if _docker_client is None:
+        # Imported here so --help and module import skip the docker SDK.
+        import docker
+
+        _docker_client = docker.from_env()
+        atexit.register(_docker_client.close)
+    return _docker_client
+
+
+def _compute_usage(stats: dict) -> tuple[float, int, int, float]:
+    """Derive CPU percent and memory usage/limit/percent from a stats sample."""
+    cpu_stats = stats["cpu_stats"]
+    precpu_stats = stats["precpu_stats"]
+    cpu_delta = (
+        cpu_stats["cpu_usage"]["total_usage"] - precpu_stats["cpu_usage"]["total_usage"]
+    )
+    system_delta = cpu_stats["system_cpu_usage"] - precpu_stats["system_cpu_usage"]
+    # Older daemons omit online_cpus; fall back like the docker CLI does.
+    num_cpus = (
+        cpu_stats.get("online_cpus")
+        or len(cpu_stats["cpu_usage"].get("percpu_usage") or ())
+        or _HOST_CPUS
+    )
+    cpu_percent = (
+        (cpu_delta / system_delta) * num_cpus * 100.0 if system_delta > 0 else 0.0
+    )
+
+    mem_usage = stats["memory_stats"].get("usage", 0)
+    mem_limit = stats["memory_stats"].get("limit", 1)
+    mem_percent = (mem_usage / mem_limit) * 100.0 if mem_limit > 0 else 0.0
+
+    return cpu_percent, mem_usage, mem_limit, mem_percent
+
+
+def _read_cgroup_int(path: str) -> int | None:
+    """Read a single integer cgroup file; ``None`` if absent or unlimited."""
+    try:
+        with open(path) as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+    return None if value == "max" else int(value)
+
+
+def _read_cgroup_keyed(path: str, key: str) -> int | None:
+    """Read one ``key value`` entry from a flat-keyed cgroup file (e.g. ``cpu.stat``)."""
+    try:
+        with open(path) as f:
+            for line in f:
+                name, _, value = line.partition(" ")
+                if name == key:
+                    return int(value)
+    except OSError:
+        pass
+    return None
+
+
+def _read_cgroup_sample(container_id: str) -> tuple[int, int, int | None] | None:
+    """Read cumulative CPU ns, working-set memory and limit from cgroupfs.
+
+    Memory excludes inactive page cache, like the docker CLI does, so the
+    numbers match the stats API.  ``None`` if the cgroup is not visible.
+    """
+    for base in (
+        f"{_CGROUP_ROOT}/system.slice/docker-{container_id}.scope",
+        f"{_CGROUP_ROOT}/docker/{container_id}",
+    ):
+        usage_usec = _read_cgroup_keyed(f"{base}/cpu.stat", "usage_usec")
+        if usage_usec is not None:
+            cpu_ns = usage_usec * 1000
+            mem_usage = _read_cgroup_int(f"{base}/memory.current")
+            mem_limit = _read_cgroup_int(f"{base}/memory.max")
+            inactive_file = _read_cgroup_keyed(f"{base}/memory.stat", "inactive_file")
+            break
+    else:
+        cpu_ns = _read_cgroup_int(
+            f"{_CGROUP_ROOT}/cpuacct/docker/{container_id}/cpuacct.usage"
+        )
+        mem_base = f"{_CGROUP_ROOT}/memory/docker/{container_id}"
+        mem_usage = _read_cgroup_int(f"{mem_base}/memory.usage_in_bytes")
+        mem_limit = _read_cgroup_int(f"{mem_base}/memory.limit_in_bytes")
+        inactive_file = _read_cgroup_keyed(
+            f"{mem_base}/memory.stat", "total_inactive_file"
+        )
+
+    if cpu_ns is None or mem_usage is None:
+        return None
+    if inactive_file is not None and inactive_file < mem_usage:
+        mem_usage -= inactive_file
+    return cpu_ns, mem_usage, mem_limit
+
+
+def _cgroup_usage(container_id: str) -> tuple[float, int, int, float] | None:
+    """Read CPU and memory usage for a container directly from cgroupfs.
+
+    Supports cgroup v2 (systemd and cgroupfs drivers) and cgroup v1.
+    Returns ``None`` when the container's cgroup is not visible on this
+    host so callers can fall back to the stats API.  CPU% is measured
+    against the previous read of the same container; the first read takes
+    a second sample ``CGROUP_CPU_SAMPLE_SECONDS`` later.  Blocking.
+    """
+    sample = _read_cgroup_sample(container_id)
+    if sample is None:
+        return None
+    now_ns = time.monotonic_ns()
+
+    prev = _cgroup_prev_cpu.get(container_id)
+    if prev is None:
+        prev = (sample[0], now_ns)
+        time.sleep(CGROUP_CPU_SAMPLE_SECONDS)
+        sample = _read_cgroup_sample(container_id)
+        if sample is None:
+            return None
+        now_ns = time.monotonic_ns()
+
+    cpu_ns, mem_usage, mem_limit = sample
+    _cgroup_prev_cpu[container_id] = (cpu_ns, now_ns)
+    cpu_percent = 0.0
+    if now_ns > prev[1]:
+        # Same scale as the stats API: 100% == one fully busy core.
+        cpu_percent = (cpu_ns - prev[0]) / (now_ns - prev[1]) * 100.0
+
+    # Unlimited containers report host memory, matching the stats API.
+    if mem_limit is None or mem_limit > _HOST_MEMORY_BYTES:
+        mem_limit = _HOST_MEMORY_BYTES
+
+    mem_percent = (mem_usage / mem_limit) * 100.0 if mem_limit > 0 else 0.0
+    return cpu_percent, mem_usage, mem_limit, mem_percent
+
+
+def _summarize_all(
+    names: list[str], usages: list[tuple[float, int, int, float] | None]
+) -> dict:
+    """Build the column-oriented overview for all containers.
+
+    Each metric is a list indexed like ``containers``.  A container whose
+    usage could not be sampled has ``None`` in every metric column.
+    """
+    count = len(names)
+    cpu_pcts = [None] * count
+    mem_mb = [None] * count
+    mem_pcts = [None] * count
+    for i, usage in enumerate(usages):
+        if usage is None:
+            continue
+        cpu_percent, mem_usage, _mem_limit, mem_percent = usage
+        cpu_pcts[i] = round(cpu_percent, 2)
+        mem_mb[i] = round(mem_usage / (1024**2), 2)
+        mem_pcts[i] = round(mem_percent, 2)
+    return {
+        "containers": names,
+        "cpu_percent": cpu_pcts,
+        "memory_usage_mb": mem_mb,
+        "memory_percent": mem_pcts,
+    }
+
+
+def _container_usage(container) -> tuple[float, int, int, float]:
+    """Return usage for *container*, preferring cgroupfs over the stats API.
+
+    Blocking; run in a worker thread.  The stats API fallback is an HTTP
+    round-trip to dockerd that waits between two samples to compute CPU%.
+    """
+    usage = _cgroup_usage(container.id) if _USE_CGROUPS else None
+    if usage is None:
+        usage = _compute_usage(container.stats(stream=False))
+    return usage
+
+
+async def _sample_with_timeout(container) -> tuple[float, int, int, float] | None:
+    """Sample *container* off the event loop, bounded by ``STATS_TIMEOUT_SECONDS``.
+
+    Returns ``None`` if the sample did not complete in time.
+    """
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(_container_usage, container),
+            timeout=STATS_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        return None
+
+
+async def _sample_by_id(container_id: str) -> tuple[float, int, int, float] | None:
+    """Look up *container_id* and sample it; ``None`` if it is gone or times out."""
+    from docker.errors import NotFound
+
+    try:
+        container = await asyncio.to_thread(
+            _get_docker_client().containers.get, container_id
+        )
+    except NotFound:
+        return None
+    return await _sample_with_timeout(container)
+
+
+class StatsCache:
+    """Keep the most recent stats sample for every running container.
+
+    One daemon thread per container consumes ``container.stats(stream=True)``
+    and overwrites the cached sample, so tool calls read the latest value
+    without a round-trip to dockerd.  Intermediate samples are discarded.
+    A second thread watches container lifecycle events to start readers
+    for new containers and drop them when a container dies.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        # container id -> (monotonic timestamp, container name, raw stats)
+        self._samples: dict[str, tuple[float, str, dict]] = {}
+        self._readers: dict[str, threading.Thread] = {}
+        self._events = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start readers for running containers and the lifecycle watcher."""
+        for container in self._client.containers.list():
+            self._start_reader(container)
+        self._events = self._client.events(decode=True, filters={"type": "container"})
+        threading.Thread(target=self._watch_events, daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop the lifecycle watcher and signal all readers to exit."""
+        self._stopped.set()
+        if self._events is not None:
+            self._events.close()
+
+    def find(self, container_name_or_id: str) -> tuple[str, dict] | None:
+        """Return ``(name, stats)`` for a container by name or ID prefix."""
+        if not container_name_or_id:
+            return None
+        for container_id, (_ts, name, stats) in list(self._samples.items()):
+            if name == container_name_or_id or container_id.startswith(
+                container_name_or_id
+            ):
+                return name, stats
+        return None
+
+    def snapshot(self) -> dict[str, tuple[str, dict]]:
+        """Return ``{container_id: (name, stats)}`` for every cached sample."""
+        return {
+            container_id: (name, stats)
+            for container_id, (_ts, name, stats) in list(self._samples.items())
+        }
+
+    def _start_reader(self, container) -> None:
+        if container.id in self._readers:
+            return
+        reader = threading.Thread(
+            target=self._read_stats, args=(container,), daemon=True
+        )
+        self._readers[container.id] = reader
+        reader.start()
+
+    def _read_stats(self, container) -> None:
+        from docker.errors import DockerException
+
+        container_id = container.id
+        try:
+            for stats in container.stats(stream=True, decode=True):
+                if (
+                    self._stopped.is_set()
+                    or self._readers.get(container_id) is not threading.current_thread()
+                ):
+                    break
+                # The first frame arrives before dockerd has a previous sample,
+                # so it cannot yield CPU% yet; keep waiting for the second.
+                if "system_cpu_usage" not in stats.get("precpu_stats", {}):
+                    continue
+                self._samples[container_id] = (time.monotonic(), container.name, stats)
+        except DockerException:
+            pass  # container went away mid-stream
+        finally:
+            if self._readers.get(container_id) is threading.current_thread():
+                del self._readers[container_id]
+                self._samples.pop(container_id, None)
+
+    def _watch_events(self) -> None:
+        from docker.errors import NotFound
+
+        try:
+            for event in self._events:
+                action = event.get("Action") or event.get("status")
+                container_id = event.get("id", "")
+                if action == "start":
+                    try:
+                        self._start_reader(self._client.containers.get(container_id))
+                    except NotFound:
+                        pass
+                elif action == "die":
+                    self._readers.pop(container_id, None)
+                    self._samples.pop(container_id, None)
+        except Exception:
+            if not self._stopped.is_set():
+                raise
 
 
 async def main(transport_type: str, endpoint: str, name: str, block: bool = True):
     mcp = FastMCP()
 
+    # The streaming cache only pays off when stats come from the API; the
+    # per-call fallback below still covers containers it has not seen yet.
+    stats_cache = None if _USE_CGROUPS else StatsCache(_get_docker_client())
+    if stats_cache is not None:
+        await asyncio.to_thread(stats_cache.start)
+
     @mcp.tool()
     async def list_containers() -> str:
         """List all running Docker containers with name, image, and status."""
-        client = _get_docker_client()
-        containers = client.containers.list()
-        result = []
-        for c in containers:
-            result.append(
-                {
-                    "id": c.short_id,
-                    "name": c.name,
-                    "image": str(c.image.tags[0])
-                    if c.image.tags
-                    else str(c.image.id[:12]),
-                    "status": c.status,
-                }
-            )
-        client.close()
+        # One bulk /containers/json call: containers.list() would inspect
+        # every container and resolving c.image inspects every image.
+        containers = await asyncio.to_thread(_get_docker_client().api.containers)
+        result = [
+            {
+                "id": c["Id"][:12],
+                "name": c["Names"][0].lstrip("/"),
+                "image": c["Image"],
+                "status": c["State"],
+            }
+            for c in containers
+        ]
         return json.dumps(result, indent=2)
 
     @mcp.tool()
@@ -60,77 +408,57 @@ async def main(transport_type: str, endpoint: str, name: str, block: bool = True
         Args:
             container_name_or_id: The container name or ID to inspect.
         """
-        client = _get_docker_client()
-        container = client.containers.get(container_name_or_id)
-        stats = container.stats(stream=False)
-
-        cpu_delta = (
-            stats["cpu_stats"]["cpu_usage"]["total_usage"]
-            - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-        )
-        system_delta = (
-            stats["cpu_stats"]["system_cpu_usage"]
-            - stats["precpu_stats"]["system_cpu_usage"]
-        )
-        num_cpus = stats["cpu_stats"].get("online_cpus", 1)
-        cpu_percent = (
-            (cpu_delta / system_delta) * num_cpus * 100.0 if system_delta > 0 else 0.0
-        )
-
-        mem_usage = stats["memory_stats"].get("usage", 0)
-        mem_limit = stats["memory_stats"].get("limit", 1)
-        mem_percent = (mem_usage / mem_limit) * 100.0 if mem_limit > 0 else 0.0
+        cached = stats_cache.find(container_name_or_id) if stats_cache else None
+        if cached is not None:
+            container_name, stats = cached
+            usage = _compute_usage(stats)
+        else:
+            # Not cached (cgroup path, or just started) — sample directly.
+            container = await asyncio.to_thread(
+                _get_docker_client().containers.get, container_name_or_id
+            )
+            usage = await asyncio.to_thread(_container_usage, container)
+            container_name = container.name
 
+        cpu_percent, mem_usage, mem_limit, mem_percent = usage
         result = {
-            "container": container.name,
+            "container": container_name,
             "cpu_percent": round(cpu_percent, 2),
             "memory_usage_mb": round(mem_usage / (1024**2), 2),
             "memory_limit_mb": round(mem_limit / (1024**2), 2),
             "memory_percent": round(mem_percent, 2),
         }
-        client.close()
         return json.dumps(result, indent=2)
 
     @mcp.tool()
     async def get_all_container_stats() -> str:
-        """Get CPU and memory overview for all running containers."""
-        client = _get_docker_client()
-        containers = client.containers.list()
-        results = []
+        """Get CPU and memory overview for all running containers.
 
-        for container in containers:
-            stats = container.stats(stream=False)
+        Returns one list per metric, indexed like ``containers``.  Null
+        entries mean that container's sample timed out or it exited meanwhile.
+        """
+        if stats_cache is not None:
+            # Bulk listing is cheap; only containers the cache has not seen
+            # yet (just started, or awaiting their second frame) are sampled.
+            snapshot = stats_cache.snapshot()
+            running = await asyncio.to_thread(_get_docker_client().api.containers)
+            names = [c["Names"][0].lstrip("/") for c in running]
 
-            cpu_delta = (
-                stats["cpu_stats"]["cpu_usage"]["total_usage"]
-                - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-            )
-            system_delta = (
-                stats["cpu_stats"]["system_cpu_usage"]
-                - stats["precpu_stats"]["system_cpu_usage"]
-            )
-            num_cpus = stats["cpu_stats"].get("online_cpus", 1)
-            cpu_percent = (
-                (cpu_delta / system_delta) * num_cpus * 100.0
-                if system_delta > 0
-                else 0.0
-            )
+            async def usage_for(container_id: str):
+                cached = snapshot.get(container_id)
+                if cached is not None:
+                    return _compute_usage(cached[1])
+                return await _sample_by_id(container_id)
 
-            mem_usage = stats["memory_stats"].get("usage", 0)
-            mem_limit = stats["memory_stats"].get("limit", 1)
-            mem_percent = (mem_usage / mem_limit) * 100.0 if mem_limit > 0 else 0.0
-
-            results.append(
-                {
-                    "container": container.name,
-                    "cpu_percent": round(cpu_percent, 2),
-                    "memory_usage_mb": round(mem_usage / (1024**2), 2),
-                    "memory_percent": round(mem_percent, 2),
-                }
-            )
+            usages = await asyncio.gather(*(usage_for(c["Id"]) for c in running))
+            return json.dumps(_summarize_all(names, list(usages)), indent=2)
 
-        client.close()
-        return json.dumps(results, indent=2)
+        # cgroup path — sample every container directly.
+        containers = await asyncio.to_thread(_get_docker_client().containers.list)
+        names = [c.name for c in containers]
+        usages = await asyncio.gather(*(_sample_with_timeout(c) for c in containers))
+
+        return json.dumps(_summarize_all(names, list(usages)), indent=2)
 
     transport = factory.create_transport(transport_type, endpoint=endpoint, name=name)
 
@@ -138,17 +466,23 @@ async def main(transport_type: str, endpoint: str, name: str, block: bool = True
     app_session.add(mcp._mcp_server).with_transport(transport).with_topic(
         "docker_monitor.mcp"
     ).with_session_id("default_session").build()
-    await app_session.start_all_sessions(keep_alive=block)
+    try:
+        await app_session.start_all_sessions(keep_alive=block)
+    finally:
+        if block and stats_cache is not None:
+            stats_cache.stop()
 
 
 if __name__ == "__main__":
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Run the Docker Monitor MCP server with a specified transport."
     )
     parser.add_argument(
         "--transport",
         type=str,
-        choices=AgntcyFactory().registered_transports(),
+        choices=factory.registered_transports(),
         default="NATS",
         help="Transport type to use (default: NATS)",
     )
@@ -172,4 +506,11 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args()
-    asyncio.run(main(args.transport, args.endpoint, args.name, args.block))
+    # Use uvloop's faster event loop when it is installed.
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+    run(main(args.transport, args.endpoint, args.name, args.block))
@@ -10,33 +10,78 @@ an Agntcy SDK transport (SLIM or NATS).
 Topic: host_monitor.mcp
 
 Requires: pip install psutil
+Optional: pip install uvloop (faster event loop)
 """
 
 import asyncio
-import argparse
 import json
 import time
 
-import psutil
 from mcp.server.fastmcp import FastMCP
 
 from agntcy_app_sdk.factory import AgntcyFactory
 
 factory = AgntcyFactory(enable_tracing=False)
 
+CPU_SAMPLE_INTERVAL_SECONDS = 1.0
+
+# Window of the first CPU reading, taken at startup so early tool calls do
+# not report an idle host before the first full interval has elapsed.
+CPU_PRIME_SECONDS = 0.1
+
+# Latest CPU utilization, refreshed in the background by _sample_cpu_forever
+# so tool calls never block the event loop waiting on psutil.
+_cpu_overall: float = 0.0
+_cpu_per_core: list[float] = []
+
+
+def _sample_cpu() -> None:
+    """Store CPU utilization measured since the previous call."""
+    import psutil
+
+    global _cpu_overall, _cpu_per_core
+    # Both values are read together so they always cover the same window.
+    _cpu_overall = psutil.cpu_percent(interval=None)
+    _cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
+
+
+async def _prime_cpu_sample() -> None:
+    """Take the first real CPU reading.
+
+    With interval=None psutil measures since the previous call, so the
+    first call only primes its counters.
+    """
+    _sample_cpu()
+    await asyncio.sleep(CPU_PRIME_SECONDS)
+    _sample_cpu()
+
+
+async def _sample_cpu_forever():
+    """Refresh the cached CPU utilization once per sample interval."""
+    while True:
+        await asyncio.sleep(CPU_SAMPLE_INTERVAL_SECONDS)
+        _sample_cpu()
+
 
 async def main(transport_type: str, endpoint: str, name: str, block: bool = True):
+    # Imported here so --help and module import skip psutil.
+    import psutil
+
     mcp = FastMCP()
 
+    # Host facts that do not change while the server runs.
+    core_count = psutil.cpu_count(logical=True)
+    mem_total = psutil.virtual_memory().total
+    mem_total_gb = round(mem_total / (1024**3), 2)
+    boot_time = psutil.boot_time()
+
     @mcp.tool()
     async def get_cpu_usage() -> str:
         """Return per-core and overall CPU utilization percentages."""
-        per_core = psutil.cpu_percent(interval=1, percpu=True)
-        overall = psutil.cpu_percent(interval=0)
         result = {
-            "overall_percent": overall,
-            "per_core_percent": per_core,
-            "core_count": psutil.cpu_count(logical=True),
+            "overall_percent": _cpu_overall,
+            "per_core_percent": _cpu_per_core,
+            "core_count": core_count,
         }
         return json.dumps(result, indent=2)
 
@@ -45,11 +90,11 @@ async def main(transport_type: str, endpoint: str, name: str, block: bool = True
         """Return RAM statistics: total, available, used, and percent used."""
         mem = psutil.virtual_memory()
         result = {
-            "total_bytes": mem.total,
+            "total_bytes": mem_total,
             "available_bytes": mem.available,
             "used_bytes": mem.used,
             "percent_used": mem.percent,
-            "total_gb": round(mem.total / (1024**3), 2),
+            "total_gb": mem_total_gb,
             "available_gb": round(mem.available / (1024**3), 2),
             "used_gb": round(mem.used / (1024**3), 2),
         }
@@ -58,22 +103,19 @@ async def main(transport_type: str, endpoint: str, name: str, block: bool = True
     @mcp.tool()
     async def get_system_summary() -> str:
         """Return a combined summary of CPU, memory, and system uptime."""
-        cpu_overall = psutil.cpu_percent(interval=1)
-        cpu_per_core = psutil.cpu_percent(interval=0, percpu=True)
         mem = psutil.virtual_memory()
-        boot_time = psutil.boot_time()
         uptime_seconds = time.time() - boot_time
         hours, remainder = divmod(int(uptime_seconds), 3600)
         minutes, seconds = divmod(remainder, 60)
 
         result = {
             "cpu": {
-                "overall_percent": cpu_overall,
-                "per_core_percent": cpu_per_core,
-                "core_count": psutil.cpu_count(logical=True),
+                "overall_percent": _cpu_overall,
+                "per_core_percent": _cpu_per_core,
+                "core_count": core_count,
             },
             "memory": {
-                "total_gb": round(mem.total / (1024**3), 2),
+                "total_gb": mem_total_gb,
                 "used_gb": round(mem.used / (1024**3), 2),
                 "available_gb": round(mem.available / (1024**3), 2),
                 "percent_used": mem.percent,
@@ -88,17 +130,30 @@ async def main(transport_type: str, endpoint: str, name: str, block: bool = True
     app_session.add(mcp._mcp_server).with_transport(transport).with_topic(
         "host_monitor.mcp"
     ).with_session_id("default_session").build()
-    await app_session.start_all_sessions(keep_alive=block)
+
+    await _prime_cpu_sample()
+    cpu_sampler = asyncio.create_task(_sample_cpu_forever())
+    try:
+        await app_session.start_all_sessions(keep_alive=block)
+    except BaseException:
+        cpu_sampler.cancel()
+        raise
+    # In non-blocking mode the server keeps serving on the caller's event
+    # loop after main() returns, so the sampler is deliberately left running.
+    if block:
+        cpu_sampler.cancel()
 
 
 if __name__ == "__main__":
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Run the Host Monitor MCP server with a specified transport."
     )
     parser.add_argument(
         "--transport",
         type=str,
-        choices=AgntcyFactory().registered_transports(),
+        choices=factory.registered_transports(),
         default="NATS",
         help="Transport type to use (default: NATS)",
     )
@@ -122,4 +177,11 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args()
-    asyncio.run(main(args.transport, args.endpoint, args.name, args.block))
+    # Use uvloop's faster event loop when it is installed.
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+    run(main(args.transport, args.endpoint, args.name, args.block))
@@ -14,81 +14,99 @@ servers by targeting different topics.
 
 Requires: host_monitor_server.py and docker_monitor_server.py running
 on the same transport.
+Optional: pip install uvloop (faster event loop)
 """
 
 import asyncio
-import argparse
-import json
 
 from agntcy_app_sdk.factory import AgntcyFactory
 
 factory = AgntcyFactory(enable_tracing=False)
 
+# Upper bound on topics queried at the same time over the shared transport.
+MAX_CONCURRENT_QUERIES = 8
+
 
 def _extract_text(result) -> str:
-    """Extract and pretty-print text from a tool call result."""
+    """Extract the text from a tool call result.
+
+    The monitor servers already return pretty-printed JSON, so the text
+    is passed through as-is rather than parsed and re-serialized.
+    """
     content_list = result.content
     if isinstance(content_list, list) and len(content_list) > 0:
-        text = content_list[0].text
-        try:
-            parsed = json.loads(text)
-            return json.dumps(parsed, indent=2)
-        except (json.JSONDecodeError, TypeError):
-            return text
+        return content_list[0].text
     return "No content returned."
 
 
-async def _query_server(topic: str, transport_type: str, endpoint: str):
-    """Create a client for the given topic, list tools, and call each one."""
-    clean_name = topic.replace(".", "_")
-    transport = factory.create_transport(
-        transport_type,
-        endpoint=endpoint,
-        name=f"default/default/client_{clean_name}",
-    )
+async def _query_server(topic: str, transport, limit: asyncio.Semaphore) -> str:
+    """Create a client for the given topic, list tools, and call each one.
 
-    mcp_client = await factory.mcp().create_client(
-        topic=topic,
-        transport=transport,
-    )
+    At most ``MAX_CONCURRENT_QUERIES`` topics are queried at once (bounded
+    by *limit*).  Returns the formatted report so concurrent queries do not
+    interleave their output.
+    """
+    lines: list[str] = []
+
+    async with limit:
+        mcp_client = await factory.mcp().create_client(
+            topic=topic,
+            transport=transport,
+        )
 
-    async with mcp_client as client:
-        try:
+        async with mcp_client as client:
             tools = await client.list_tools()
-            tool_names = [t.name for t in tools.tools]
+            tool_names = {t.name for t in tools.tools}
 
-            print(f"Tools on [{topic}]:")
+            lines.append(f"Tools on [{topic}]:")
             for tool in tools.tools:
-                print(f"  - {tool.name}: {tool.description}")
-            print()
-
-            # Call one representative host tool if available
-            if "get_system_summary" in tool_names:
-                print("--- get_system_summary ---")
-                result = await client.call_tool(name="get_system_summary", arguments={})
-                print(_extract_text(result))
-                print()
-
-            # Call one representative container tool if available
-            if "list_containers" in tool_names:
-                print("--- list_containers ---")
-                result = await client.call_tool(name="list_containers", arguments={})
-                print(_extract_text(result))
-                print()
-
-        finally:
-            await transport.close()
+                lines.append(f"  - {tool.name}: {tool.description}")
+            lines.append("")
+
+            # Call the representative host / container tools this server exposes
+            selected = [
+                name
+                for name in ("get_system_summary", "list_containers")
+                if name in tool_names
+            ]
+            results = await asyncio.gather(
+                *(client.call_tool(name=name, arguments={}) for name in selected)
+            )
+            for name, result in zip(selected, results):
+                lines.append(f"--- {name} ---")
+                lines.append(_extract_text(result))
+                lines.append("")
+
+    return "\n".join(lines)
 
 
 async def main(transport_type: str, endpoint: str, topics: list[str]):
-    for topic in topics:
+    transport = factory.create_transport(
+        transport_type,
+        endpoint=endpoint,
+        name="default/default/monitoring_client",
+    )
+    # Connect once up front; every topic query shares this transport.
+    await transport.setup()
+
+    limit = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    try:
+        reports = await asyncio.gather(
+            *(_query_server(topic, transport, limit) for topic in topics)
+        )
+    finally:
+        await transport.close()
+
+    for topic, report in zip(topics, reports):
         print("=" * 60)
         print(f"Querying topic: {topic}")
         print("=" * 60)
-        await _query_server(topic, transport_type, endpoint)
+        print(report)
 
 
 if __name__ == "__main__":
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Run the Monitoring MCP client — queries multiple MCP servers via topics."
     )
@@ -113,4 +131,11 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args()
-    asyncio.run(main(args.transport, args.endpoint, args.topics))
+    # Use uvloop's faster event loop when it is installed.
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+    run(main(args.transport, args.endpoint, args.topics))
@@ -52,7 +52,15 @@ def _get_handler_map() -> dict[type, type]:
 
 def _resolve_handler_class(target: Any) -> type:
     """Return the handler class for the given target instance."""
-    for target_type, handler_class in _get_handler_map().items():
+    handler_map = _get_handler_map()
+    # Walk the target's MRO so that registered server types and their
+    # subclasses both resolve through dict lookups (nearest base first).
+    for target_type in type(target).__mro__:
+        handler_class = handler_map.get(target_type)
+        if handler_class is not None:
+            return handler_class
+    # Objects that only pass isinstance() (virtual subclasses, proxies)
+    for target_type, handler_class in handler_map.items():
         if isinstance(target, target_type):
             return handler_class
     raise ValueError(f"Unsupported target type: {type(target).__name__}")
@@ -169,6 +177,9 @@ class AppContainer:
         self._directory = directory
         self._directory_cid: Optional[str] = None
         self._shutdown_event: Optional[asyncio.Event] = None
+        # Set once handler.setup() has completed, before the directory steps,
+        # so a start cancelled part-way can still tear the handler down.
+        self._handler_ready = False
         self.is_running = False
 
     # -- Convenience properties that delegate to the handler ----------------
@@ -198,6 +209,7 @@ class AppContainer:
             return
 
         await self.handler.setup()
+        self._handler_ready = True
 
         # Directory lifecycle: setup + push record (if configured)
         if self._directory:
@@ -238,7 +250,9 @@ class AppContainer:
         except asyncio.CancelledError:
             logger.debug("Event loop cancelled; shutting down gracefully...")
         finally:
-            await self.stop()
+            # stop() may already have run and woken us up
+            if self.is_running:
+                await self.stop()
 
     async def _handle_shutdown(self, sig: signal.Signals):
         """Handle shutdown signals gracefully."""
@@ -252,9 +266,13 @@ class AppContainer:
         """Stop all components of the app container."""
         logger.debug("Stopping app session...")
         await self.handler.teardown()
+        self._handler_ready = False
         if self._directory:
             await self._directory.teardown()
         self.is_running = False
+        # Release loop_forever() if it is parked on the shutdown event
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
         logger.debug("App session stopped. Exiting event loop.")
 
 
@@ -269,7 +287,6 @@ class AppSession:
     def __init__(self, max_sessions: int = 10):
         self.max_sessions = max_sessions
         self.app_containers: dict[str, AppContainer] = {}
-        self._lock = asyncio.Lock()
 
     # -- Fluent entry point -------------------------------------------------
 
@@ -347,14 +364,46 @@ class AppSession:
     async def start_all_sessions(self, keep_alive: bool = False):
         """Start all app containers.
 
-        Each container's ``setup()`` is called sequentially.  When
-        *keep_alive* is ``True``, **all** containers are started first and
-        then the session blocks on a shutdown signal — otherwise only the
+        Containers are started concurrently, so startup takes as long as the
+        slowest transport connection rather than the sum of all of them.
+        Tasks are created in registration order and each handler stamps the
+        shared agent card before its first ``await``, so card precedence is
+        unchanged.  If any container fails to start, the others are
+        cancelled, every container whose handler finished setting up is
+        stopped (even if its directory registration was still pending), and
+        the error is re-raised.
+
+        When *keep_alive* is ``True``, **all** containers are started first
+        and then the session blocks on a shutdown signal — otherwise only the
         first container would block and the rest would never start.
         """
-        for container in self.app_containers.values():
-            if not container.is_running:
-                await container.run(keep_alive=False)
+        tasks = [
+            asyncio.create_task(container.run(keep_alive=False))
+            for container in self.app_containers.values()
+            if not container.is_running
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(
+                *(
+                    container.stop()
+                    for container in self.app_containers.values()
+                    if container.is_running or container._handler_ready
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                # Surface the start failure, not a secondary teardown error
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Error stopping app containers after a failed start: %s",
+                        result,
+                    )
+            raise
 
         if keep_alive and self.app_containers:
             # Pick any running container to wait on — they all share the
@@ -363,7 +412,20 @@ class AppSession:
             await first.loop_forever()
 
     async def stop_all_sessions(self):
-        """Stop all running app containers."""
-        for container in self.app_containers.values():
-            if container.is_running:
-                await container.stop()
+        """Stop all running app containers.
+
+        Containers are torn down concurrently.  Every container is given the
+        chance to stop even if another one fails; the first error is
+        re-raised once all of them have finished.
+        """
+        results = await asyncio.gather(
+            *(
+                container.stop()
+                for container in self.app_containers.values()
+                if container.is_running
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
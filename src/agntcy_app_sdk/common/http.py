@@ -0,0 +1,41 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from typing import Any, Optional
+
+import httpx
+
+
+class PooledHTTPClient:
+    """Lazily created ``httpx.AsyncClient`` owned by a single object.
+
+    An ``httpx.AsyncClient`` keeps its pooled connections on the event loop
+    that opened them, so a client created under one ``asyncio.run()`` cannot
+    be used from the next.  :meth:`get` returns the same client for as long
+    as the running loop is unchanged and starts a fresh one otherwise.  The
+    owner is responsible for calling :meth:`aclose` on shutdown.
+    """
+
+    def __init__(self, **client_kwargs: Any):
+        self._client_kwargs = client_kwargs
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is None or client.is_closed or self._loop is not loop:
+            # A client left over from another loop cannot be closed from
+            # here; its connections died with that loop.
+            client = httpx.AsyncClient(**self._client_kwargs)
+            self._client, self._loop = client, loop
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client.  Safe to call more than once."""
+        client, self._client = self._client, None
+        loop, self._loop = self._loop, None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import inspect
 import os
 from typing import Any, Dict, Protocol, Type
 
@@ -13,10 +16,6 @@ from agntcy_app_sdk.directory.dir.agent_directory import AgentDirectory
 from agntcy_app_sdk.semantic.client_factory_base import BaseClientFactory
 from agntcy_app_sdk.transport.base import BaseTransport
 
-from agntcy_app_sdk.transport.nats.transport import NatsTransport
-from agntcy_app_sdk.transport.slim.transport import SLIMTransport
-from agntcy_app_sdk.transport.streamable_http.transport import StreamableHTTPTransport
-
 from agntcy_app_sdk.semantic.a2a.client.factory import A2AClientFactory
 from agntcy_app_sdk.semantic.a2a.client.config import ClientConfig
 from agntcy_app_sdk.semantic.fast_mcp.client_factory import FastMCPClientFactory
@@ -24,6 +23,47 @@ from agntcy_app_sdk.semantic.mcp.client_factory import MCPClientFactory
 
 logger = get_logger(__name__)
 
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+# Well-known transports, keyed by each class's ``TRANSPORT_TYPE``.  They are
+# referenced as ``"module:ClassName"`` so that a transport's module (and its
+# client library, e.g. nats-py) is only imported when that transport is used.
+_WELLKNOWN_TRANSPORTS: Dict[str, str] = {
+    "SLIM": "agntcy_app_sdk.transport.slim.transport:SLIMTransport",
+    "NATS": "agntcy_app_sdk.transport.nats.transport:NatsTransport",
+    "STREAMABLE_HTTP": (
+        "agntcy_app_sdk.transport.streamable_http.transport:StreamableHTTPTransport"
+    ),
+}
+
+
+# Well-known directories, keyed by each class's ``DIRECTORY_TYPE``.
+_WELLKNOWN_DIRECTORIES: Dict[str, Type[BaseAgentDirectory]] = {
+    directory_class.DIRECTORY_TYPE: directory_class
+    for directory_class in (AgentDirectory,)
+}
+
+
+def _load_transport_class(path: str) -> Type[BaseTransport]:
+    """Import and return the transport class referenced by ``"module:Class"``."""
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@functools.cache
+def _wellknown_protocol_registry() -> Dict[str, type]:
+    """Map each well-known protocol label to its client factory class.
+
+    Deriving the label requires instantiating the factory (``protocol_type()``
+    is an instance method), so the mapping is built once per process rather
+    than on every ``AgntcyFactory()``.
+    """
+    return {
+        factory_class().protocol_type(): factory_class
+        for factory_class in (A2AClientFactory, MCPClientFactory, FastMCPClientFactory)
+    }
+
 
 # ---------------------------------------------------------------------------
 # Type stubs for the dynamically-attached accessors.
@@ -109,14 +149,14 @@ class AgntcyFactory:
 
         # Validate and store log level
         self.log_level = log_level
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if log_level.upper() not in valid_levels:
+        if log_level.upper() not in _VALID_LOG_LEVELS:
             logger.error("Invalid log level, defaulting to INFO", requested=log_level)
             self.log_level = "INFO"
 
-        self._transport_registry: Dict[str, Type[BaseTransport]] = {}
+        self._transport_registry: Dict[str, Type[BaseTransport] | str] = {}
         self._protocol_registry: Dict[str, type] = {}
         self._directory_registry: Dict[str, Type[BaseAgentDirectory]] = {}
+        self._client_factory_instances: Dict[type, BaseClientFactory] = {}
 
         self._register_wellknown_transports()
         self._register_wellknown_protocols()
@@ -161,6 +201,24 @@ class AgntcyFactory:
         """Get the list of registered observability providers."""
         return list(self.OBSERVABILITY_PROVIDERS)
 
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def aclose(self) -> None:
+        """Release resources held by the cached client factories.
+
+        Call on application shutdown.  Client factories obtained from
+        accessors called with arguments (e.g. ``factory.a2a(config)``) are
+        owned by the caller and closed with their own ``aclose()``.
+        """
+        instances = list(self._client_factory_instances.values())
+        self._client_factory_instances.clear()
+        for instance in instances:
+            aclose = getattr(instance, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     # ------------------------------------------------------------------
     # Transport & session creation
     # ------------------------------------------------------------------
@@ -222,6 +280,10 @@ class AgntcyFactory:
                 f"No transport registered for transport type: {transport!r}. "
                 f"Available transports: {list(self._transport_registry.keys())}"
             )
+        if isinstance(transport_class, str):
+            # Lazily registered well-known transport: import it on first use
+            transport_class = _load_transport_class(transport_class)
+            self._transport_registry[transport] = transport_class
 
         # Build optional kwargs — only pass ``name`` when the caller supplied one
         # so that the transport's own default (``name: str = None``) is respected.
@@ -246,42 +308,56 @@ class AgntcyFactory:
     def _register_wellknown_transports(self) -> None:
         """Register well-known transports.
 
-        Each entry derives its registry key from the transport class's
-        ``TRANSPORT_TYPE`` constant — the label lives on the class itself.
+        Each entry is keyed by the transport class's ``TRANSPORT_TYPE``
+        constant and points at the class lazily (see ``_WELLKNOWN_TRANSPORTS``);
+        ``create_transport`` imports the class the first time it is used.
         """
-        for transport_class in (SLIMTransport, NatsTransport, StreamableHTTPTransport):
-            self._transport_registry[transport_class.TRANSPORT_TYPE] = transport_class
+        self._transport_registry.update(_WELLKNOWN_TRANSPORTS)
 
     def _register_wellknown_protocols(self) -> None:
         """Register well-known protocols and attach accessor methods.
 
         For each factory class, this method:
-        1. Reads ``protocol_type()`` to derive the registry key.
+        1. Reads ``protocol_type()`` to derive the registry key (computed
+           once per process, see ``_wellknown_protocol_registry``).
         2. Stores ``protocol_type → factory_class`` in the registry.
         3. Attaches a convenience accessor (e.g. ``self.a2a``) whose
            name comes from the factory's ``ACCESSOR_NAME`` constant.
+
+        Factories whose constructor takes no arguments are not configured
+        per call, so a no-argument accessor call returns one cached
+        instance per ``AgntcyFactory`` instead of building a new one every
+        time.  Resources those instances hold are released by
+        :meth:`aclose`.
         """
-        for factory_class in (A2AClientFactory, MCPClientFactory, FastMCPClientFactory):
-            proto_name = factory_class().protocol_type()
-            self._protocol_registry[proto_name] = factory_class
+        wellknown = _wellknown_protocol_registry()
+        self._protocol_registry.update(wellknown)
+
+        # Build a closure that captures the class for the accessor
+        def _make_accessor(cls: type):
+            takes_no_args = not inspect.signature(cls).parameters
 
-            # Build a closure that captures the class for the accessor
-            def _make_accessor(cls: type):
-                def accessor(*args: Any, **kwargs: Any) -> BaseClientFactory:
+            def accessor(*args: Any, **kwargs: Any) -> BaseClientFactory:
+                if args or kwargs or not takes_no_args:
                     return cls(*args, **kwargs)
+                instance = self._client_factory_instances.get(cls)
+                if instance is None:
+                    instance = cls()
+                    self._client_factory_instances[cls] = instance
+                return instance
 
-                return accessor
+            return accessor
 
+        for factory_class in wellknown.values():
             setattr(self, factory_class.ACCESSOR_NAME, _make_accessor(factory_class))
 
     def _register_wellknown_directories(self) -> None:
         """Register well-known directory implementations.
 
-        Each entry derives its registry key from the directory class's
-        ``DIRECTORY_TYPE`` constant.
+        Each entry is keyed by the directory class's ``DIRECTORY_TYPE``
+        constant (see ``_WELLKNOWN_DIRECTORIES``).
         """
-        for directory_class in (AgentDirectory,):
-            self._directory_registry[directory_class.DIRECTORY_TYPE] = directory_class
+        self._directory_registry.update(_WELLKNOWN_DIRECTORIES)
 
     def register_directory(self, directory_class: Type[BaseAgentDirectory]) -> None:
         """Register a custom directory implementation.
@@ -320,7 +320,7 @@ class A2AExperimentalClient(Client):
                     if raw_resp.type == "A2AStatusUpdate":
                         continue
 
-                    resp = json.loads(raw_resp.payload.decode("utf-8"))
+                    resp = json.loads(raw_resp.payload)
                     smr = SendMessageResponse(resp)
                     await self._consume_response(smr)
                     broadcast_responses.append(smr)
@@ -387,7 +387,7 @@ class A2AExperimentalClient(Client):
             ):
                 try:
                     logger.debug(raw_resp)
-                    resp = json.loads(raw_resp.payload.decode("utf-8"))
+                    resp = json.loads(raw_resp.payload)
 
                     if resp.get("error") == "forbidden" or raw_resp.status_code == 403:
                         logger.warning(
@@ -485,7 +485,7 @@ class A2AExperimentalClient(Client):
             groupchat_messages = []
             for raw_msg in member_messages:
                 try:
-                    resp = json.loads(raw_msg.payload.decode("utf-8"))
+                    resp = json.loads(raw_msg.payload)
                     smr = SendMessageResponse(resp)
                     await self._consume_response(smr)
                     groupchat_messages.append(smr)
@@ -527,7 +527,7 @@ class A2AExperimentalClient(Client):
             end_message=end_message,
             timeout=timeout,
         ):
-            message = json.loads(raw_member_message.payload.decode("utf-8"))
+            message = json.loads(raw_member_message.payload)
             smr = SendMessageResponse(message)
             await self._consume_response(smr)
             yield smr
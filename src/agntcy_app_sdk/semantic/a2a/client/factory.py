@@ -6,6 +6,8 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import os
+import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -18,6 +20,7 @@ from a2a.types import AgentCard
 
 from slima2a.client_transport import SRPCTransport
 
+from agntcy_app_sdk.common.http import PooledHTTPClient
 from agntcy_app_sdk.common.logging_config import get_logger
 from agntcy_app_sdk.semantic.a2a.client.config import ClientConfig
 from agntcy_app_sdk.semantic.a2a.client.experimental_patterns import (
@@ -32,6 +35,28 @@ from agntcy_app_sdk.transport.base import BaseTransport
 
 logger = get_logger(__name__)
 
+# How long a resolved AgentCard is served from a factory's cache, and how
+# many URLs each factory remembers (least recently used are evicted first).
+CARD_CACHE_TTL_SECONDS = 60.0
+CARD_CACHE_MAX_SIZE = 128
+
+
+def _config_kwargs(config: Any, exclude: tuple[str, ...]) -> dict[str, Any]:
+    """Collect the set fields of a transport config dataclass as kwargs.
+
+    Unlike ``dataclasses.asdict`` this is a shallow read: values are passed
+    through as-is instead of being deep-copied into an intermediate dict.
+    """
+    kwargs = {}
+    for field in dataclasses.fields(config):
+        name = field.name
+        if name in exclude:
+            continue
+        value = getattr(config, name)
+        if value is not None:
+            kwargs[name] = value
+    return kwargs
+
 
 class A2AClientFactory:
     """Card-driven A2A client factory.
@@ -69,6 +94,13 @@ class A2AClientFactory:
         self._config = config or ClientConfig()
         self._upstream = UpstreamClientFactory(self._config)
         self._register_transports()
+        # Card resolution reuses pooled keep-alive connections for the
+        # lifetime of this factory; see :meth:`aclose`.
+        self._http_client = PooledHTTPClient(
+            limits=httpx.Limits(max_keepalive_connections=64),
+        )
+        # url -> (expiry, card), in least- to most-recently-used order
+        self._card_cache: OrderedDict[str, tuple[float, AgentCard]] = OrderedDict()
 
     ACCESSOR_NAME: str = "a2a"
     """Method name attached to :class:`AgntcyFactory` for this protocol."""
@@ -106,14 +138,16 @@ class A2AClientFactory:
             ``A2AExperimentalClient``; for sync transports (JSONRPC,
             slimrpc) it is the upstream ``Client`` (``BaseClient``).
         """
-        self._initialize_tracing_if_enabled()
-
+        # Validate the card before doing any setup work, so an
+        # incompatible card fails without instrumenting or connecting.
         transport_label, transport_url = self._negotiate(card)
         # Resolve aliases (e.g. "slim" -> "slimpatterns") so dispatch
         # always works against canonical transport names.
         transport_label_lower = normalize_transport(transport_label)
         topic = _parse_topic_from_url(transport_url)
 
+        self._initialize_tracing_if_enabled()
+
         if transport_label_lower in ("slimpatterns", "natspatterns"):
             # Async path — we build the transport ourselves because
             # upstream ClientFactory.create() is sync and cannot call
@@ -169,7 +203,10 @@ class A2AClientFactory:
         """Convenience: resolve a card from a URL and create a client.
 
         If ``agent`` is a string, it is treated as the base URL of the
-        remote agent and the card is fetched from the well-known path.
+        remote agent and the card is fetched from the well-known path
+        over a temporary HTTP client.  To reuse connections and cached
+        cards across many agents, keep a factory and call
+        :meth:`resolve_card` and :meth:`create` instead.
         If ``agent`` is already an ``AgentCard``, it is used directly.
 
         Args:
@@ -181,21 +218,61 @@ class A2AClientFactory:
         Returns:
             A ``Client`` instance.
         """
+        config = config or ClientConfig()
+        factory = cls(config)
         if isinstance(agent, str):
-            async with httpx.AsyncClient() as http_client:
-                resolver = A2ACardResolver(http_client, base_url=agent)
-                card = await resolver.get_agent_card()
-            # Backfill empty card.url with the URL used to fetch the card,
-            # so that transport negotiation can match against it.
-            if not card.url:
-                card.url = agent
+            try:
+                card = await factory.resolve_card(agent)
+            finally:
+                await factory.aclose()
         else:
             card = agent
 
-        config = config or ClientConfig()
-        factory = cls(config)
         return await factory.create(card, consumers, interceptors)
 
+    async def resolve_card(self, url: str) -> AgentCard:
+        """Resolve the AgentCard served at *url*, reusing a recent lookup if any.
+
+        Cards are cached per factory for ``CARD_CACHE_TTL_SECONDS``, up to
+        ``CARD_CACHE_MAX_SIZE`` URLs.  Use :meth:`invalidate_card` to drop
+        an entry early, e.g. after the agent was redeployed.  A copy is
+        returned because :meth:`create` normalises cards in place.
+        """
+        now = time.monotonic()
+        cached = self._card_cache.get(url)
+        if cached is not None:
+            if cached[0] > now:
+                self._card_cache.move_to_end(url)
+                return cached[1].model_copy(deep=True)
+            del self._card_cache[url]
+
+        resolver = A2ACardResolver(self._http_client.get(), base_url=url)
+        card = await resolver.get_agent_card()
+        # Backfill empty card.url with the URL used to fetch the card,
+        # so that transport negotiation can match against it.
+        if not card.url:
+            card.url = url
+
+        self._card_cache[url] = (time.monotonic() + CARD_CACHE_TTL_SECONDS, card)
+        if len(self._card_cache) > CARD_CACHE_MAX_SIZE:
+            self._card_cache.popitem(last=False)
+        return card.model_copy(deep=True)
+
+    def invalidate_card(self, url: str | None = None) -> None:
+        """Forget the cached card for *url*, or every cached card if omitted."""
+        if url is None:
+            self._card_cache.clear()
+        else:
+            self._card_cache.pop(url, None)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client used by :meth:`resolve_card`.
+
+        Safe to call more than once; a new client is created on the next
+        :meth:`resolve_card` call.
+        """
+        await self._http_client.aclose()
+
     # ------------------------------------------------------------------
     # Transport negotiation
     # ------------------------------------------------------------------
@@ -278,12 +355,10 @@ class A2AClientFactory:
 
                 # Forward all optional fields as **kwargs so SLIMTransport
                 # picks up security, timeout, and retry settings.
-                slim_kwargs = {
-                    k: v
-                    for k, v in dataclasses.asdict(config.slim_config).items()
-                    if k not in ("endpoint", "name", "message_timeout_seconds")
-                    and v is not None
-                }
+                slim_kwargs = _config_kwargs(
+                    config.slim_config,
+                    exclude=("endpoint", "name", "message_timeout_seconds"),
+                )
                 # Convert seconds → timedelta for SLIMTransport.__init__()
                 slim_kwargs["message_timeout"] = datetime.timedelta(
                     seconds=config.slim_config.message_timeout_seconds,
@@ -311,11 +386,7 @@ class A2AClientFactory:
 
                 # Forward all optional fields as **kwargs so NatsTransport
                 # picks up connection and timeout settings.
-                nats_kwargs = {
-                    k: v
-                    for k, v in dataclasses.asdict(config.nats_config).items()
-                    if k not in ("endpoint",) and v is not None
-                }
+                nats_kwargs = _config_kwargs(config.nats_config, exclude=("endpoint",))
                 transport = NatsTransport.from_config(
                     config.nats_config.endpoint,
                     **nats_kwargs,
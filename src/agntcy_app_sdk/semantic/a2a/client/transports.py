@@ -39,6 +39,9 @@ logger = get_logger(__name__)
 # Recognized URI schemes for patterns transports
 _PATTERNS_SCHEMES = {"slim", "nats"}
 
+# Characters that make a URL non-trivial enough to need ``urlparse``
+_URL_SPECIAL_CHARS = frozenset("@?#;[] \t\r\n")
+
 
 def _parse_topic_from_url(url: str) -> str:
     """Extract a topic from a scheme-encoded URL.
@@ -54,6 +57,28 @@ def _parse_topic_from_url(url: str) -> str:
     """
     if "://" not in url:
         return url
+    # Userinfo, query, fragment, IPv6 hosts or stray whitespace: let
+    # urlparse decide.  Everything else is split with plain str ops.
+    if any(c in url for c in _URL_SPECIAL_CHARS):
+        return _parse_topic_with_urlparse(url)
+    scheme, _, rest = url.partition("://")
+    if scheme.lower() not in _PATTERNS_SCHEMES:
+        return url  # HTTP etc. — pass through unchanged
+    netloc, _, path = rest.partition("/")
+    hostname, _, port = netloc.partition(":")
+    path = path.lstrip("/")
+    if port:
+        if not (port.isascii() and port.isdigit() and int(port) <= 65535):
+            return _parse_topic_with_urlparse(url)
+        # Explicit endpoint: has a port → topic is the path
+        return path
+    # Topic-only: hostname (+ path if slashes present) IS the topic
+    hostname = hostname.lower()
+    return f"{hostname}/{path}" if path else hostname
+
+
+def _parse_topic_with_urlparse(url: str) -> str:
+    """Slow path of :func:`_parse_topic_from_url` for non-trivial URLs."""
     parsed = urlparse(url)
     if parsed.scheme.lower() not in _PATTERNS_SCHEMES:
         return url  # HTTP etc. — pass through unchanged
@@ -192,7 +217,7 @@ class PatternsClientTransport(ClientTransport):
                 self._topic,
                 message_translator(request=rpc_payload, headers=headers),
             )
-            response_payload = json.loads(response.payload.decode("utf-8"))
+            response_payload = json.loads(response.payload)
 
             # Handle Identity-Middleware auth errors
             if (
@@ -288,7 +313,7 @@ class PatternsClientTransport(ClientTransport):
             async for response in self._transport.request_stream(
                 self._topic, transport_msg
             ):
-                response_payload = json.loads(response.payload.decode("utf-8"))
+                response_payload = json.loads(response.payload)
 
                 # Handle JSON-RPC error responses
                 if "error" in response_payload:
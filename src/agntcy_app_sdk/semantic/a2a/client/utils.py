@@ -1,11 +1,10 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
-import json
 from uuid import uuid4
 from typing import Any
 
-from agntcy_app_sdk.semantic.message import Message
+from agntcy_app_sdk.semantic.message import Message, compact_json_encode
 from agntcy_app_sdk.common.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -24,7 +23,7 @@ def message_translator(
 
     message = Message(
         type="A2ARequest",
-        payload=json.dumps(request),
+        payload=compact_json_encode(request).encode("utf-8"),
         route_path="/",  # json-rpc path
         method="POST",  # A2A json-rpc will always use POST
         headers=headers,
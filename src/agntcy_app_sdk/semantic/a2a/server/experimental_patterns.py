@@ -99,6 +99,14 @@ for _method_name, _model in _A2A_METHOD_TO_MODEL.items():
             _METHOD_TO_HANDLER[_method_name] = _hname
             break
 
+# The parse-error response carries no request id or dynamic data, so it is
+# serialized once rather than on every malformed message.
+_JSON_PARSE_ERROR_PAYLOAD = (
+    JSONRPCErrorResponse(id=None, error=JSONParseError())
+    .model_dump_json(exclude_none=True)
+    .encode("utf-8")
+)
+
 
 class IdentityServiceUser(User):
     """Authenticated user validated by the Identity Service."""
@@ -292,9 +300,7 @@ class A2AExperimentalServer:
         if not self._auth_enabled:
             return True, "", _unauthenticated
 
-        auth_header = message.headers.get("Authorization") or message.headers.get(
-            "authorization"
-        )
+        auth_header = message.get_header("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
             return False, "Missing or malformed Authorization header", _unauthenticated
 
@@ -322,9 +328,7 @@ class A2AExperimentalServer:
     ) -> bytes:
         """Serialize a JSON-RPC error response to bytes."""
         resp = JSONRPCErrorResponse(id=request_id, error=error)
-        return json.dumps(resp.model_dump(mode="json", exclude_none=True)).encode(
-            "utf-8"
-        )
+        return resp.model_dump_json(exclude_none=True).encode("utf-8")
 
     async def handle_message(self, message: Message, *, publish_fn=None) -> Message:
         """Handle an incoming request by calling JSONRPCHandler directly.
@@ -339,7 +343,7 @@ class A2AExperimentalServer:
         """
         assert self._handler is not None, "JSONRPCHandler is not set up"
 
-        logger.debug(f"Handling A2A message with payload: {message}")
+        logger.debug("Handling A2A message with payload: %s", message)
 
         request_id: str | int | None = None
 
@@ -356,34 +360,33 @@ class A2AExperimentalServer:
                     reply_to=message.reply_to,
                 )
 
-            body = message.payload
-
-            # ---- Relay preservation ----------------------------------------
-            # If the body is a JSONRPCSuccessResponse (relay scenario),
-            # re-wrap it as a SendMessageRequest.
-            try:
-                inner = JSONRPCSuccessResponse.model_validate_json(body)
-                msg_params = {"message": inner.result}
-                request = SendMessageRequest(
-                    id=str(uuid4()),
-                    params=MessageSendParams(**msg_params),
-                )
-                body = json.dumps(
-                    request.model_dump(mode="json", exclude_none=True)
-                ).encode("utf-8")
-            except Exception:
-                pass
-
             # ---- Parse JSON ------------------------------------------------
+            # The body is parsed once; every later step works on the dict.
             try:
-                raw: dict[str, Any] = json.loads(body)
+                raw: dict[str, Any] = json.loads(message.payload)
             except (json.JSONDecodeError, UnicodeDecodeError):
                 return Message(
                     type="A2AResponse",
-                    payload=self._build_error_payload(None, JSONParseError()),
+                    payload=_JSON_PARSE_ERROR_PAYLOAD,
                     reply_to=message.reply_to,
                 )
 
+            # ---- Relay preservation ----------------------------------------
+            # If the body is a JSONRPCSuccessResponse (relay scenario),
+            # re-wrap it as a SendMessageRequest.  Only a body carrying a
+            # "result" can be one, so plain requests skip the attempt.
+            if isinstance(raw, dict) and "result" in raw:
+                try:
+                    inner = JSONRPCSuccessResponse.model_validate(raw)
+                    msg_params = {"message": inner.result}
+                    request = SendMessageRequest(
+                        id=str(uuid4()),
+                        params=MessageSendParams(**msg_params),
+                    )
+                    raw = request.model_dump(mode="json", exclude_none=True)
+                except Exception:
+                    pass
+
             # ---- Validate as generic JSONRPCRequest ------------------------
             try:
                 base_request = JSONRPCRequest.model_validate(raw)
@@ -468,8 +471,8 @@ class A2AExperimentalServer:
                     if publish_fn is not None and last_item is not None:
                         # Publish the *previous* item as an intermediate
                         # status update before replacing it.
-                        intermediate_payload = json.dumps(
-                            last_item.root.model_dump(mode="json", exclude_none=True)
+                        intermediate_payload = last_item.root.model_dump_json(
+                            exclude_none=True
                         ).encode("utf-8")
                         await publish_fn(
                             Message(
@@ -491,9 +494,9 @@ class A2AExperimentalServer:
                 handler_result = last_item
 
             # ---- Serialize response ----------------------------------------
-            payload = json.dumps(
-                handler_result.root.model_dump(mode="json", exclude_none=True)
-            ).encode("utf-8")
+            payload = handler_result.root.model_dump_json(exclude_none=True).encode(
+                "utf-8"
+            )
 
             return Message(
                 type="A2AResponse",
@@ -109,6 +109,12 @@ TRANSPORT_ALIASES: dict[str, str] = {
     "nats": "natspatterns",
 }
 
+# Lower-case identifier → canonical form, for both canonical names and aliases
+_NORMALIZED_TRANSPORTS: dict[str, str] = {
+    **{name: name for name in CANONICAL_TRANSPORTS},
+    **TRANSPORT_ALIASES,
+}
+
 
 def normalize_transport(raw: str) -> str:
     """Normalise a transport identifier to its canonical form.
@@ -116,5 +122,10 @@ def normalize_transport(raw: str) -> str:
     Applies case-folding and alias resolution.  Returns the canonical
     string or the lower-cased input if it is already canonical.
     """
+    # Identifiers are almost always already lower-case: resolve them with a
+    # single dict lookup before paying for the ``lower()`` copy.
+    canonical = _NORMALIZED_TRANSPORTS.get(raw)
+    if canonical is not None:
+        return canonical
     key = raw.lower()
     return TRANSPORT_ALIASES.get(key, key)
@@ -5,7 +5,7 @@ import json
 from typing import Any, Dict, Optional
 
 from agntcy_app_sdk.common.logging_config import get_logger
-from agntcy_app_sdk.semantic.message import Message
+from agntcy_app_sdk.semantic.message import Message, compact_json_encode
 from identityservice.sdk import IdentityServiceSdk
 from agntcy_app_sdk.common.auth import is_identity_auth_enabled
 
@@ -46,7 +46,7 @@ class MCPClient:
         }
         return Message(
             type="MCPRequest",
-            payload=json.dumps(payload),
+            payload=compact_json_encode(payload).encode("utf-8"),
             route_path=self.route_path,
             method="POST",
             headers=headers,
@@ -62,7 +62,7 @@ class MCPClient:
         try:
             message = self._build_message(method, params, headers, request_id)
             response = await self.transport.request(self.topic, message)
-            data = json.loads(response.payload.decode("utf-8"))
+            data = json.loads(response.payload)
             if "error" in data:
                 raise RuntimeError(f"[MCP Error] {method} failed: {data['error']}")
             return data["result"]
@@ -3,6 +3,7 @@
 
 from typing import Any, Optional
 
+from agntcy_app_sdk.common.http import PooledHTTPClient
 from agntcy_app_sdk.semantic.fast_mcp.client import MCPClient
 from agntcy_app_sdk.semantic.fast_mcp.protocol import FastMCPProtocol
 from agntcy_app_sdk.transport.base import BaseTransport
@@ -14,6 +15,11 @@ class FastMCPClientFactory:
     ACCESSOR_NAME: str = "fast_mcp"
     """Method name attached to :class:`AgntcyFactory` for this protocol."""
 
+    def __init__(self):
+        # Initialize handshakes reuse pooled keep-alive connections for the
+        # lifetime of this factory; see :meth:`aclose`.
+        self._http_client = PooledHTTPClient(timeout=10.0)
+
     def protocol_type(self) -> str:
         return "FastMCP"
 
@@ -28,5 +34,13 @@ class FastMCPClientFactory:
         """Create a FastMCP client. Delegates to FastMCPProtocol.create_client()."""
         protocol = FastMCPProtocol()
         return await protocol.create_client(
-            url=url, topic=topic, transport=transport, **kwargs
+            url=url,
+            topic=topic,
+            transport=transport,
+            http_client=self._http_client.get(),
+            **kwargs,
         )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client used for initialize handshakes."""
+        await self._http_client.aclose()
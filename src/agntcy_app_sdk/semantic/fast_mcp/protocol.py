@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import functools
 import json
 import os
+import re
 from typing import Any, Optional, Union
 
 import httpx
@@ -21,6 +23,50 @@ from identityservice.auth.starlette import IdentityServiceMCPMiddleware
 
 logger = get_logger(__name__)
 
+# Headers that are identical on every request forwarded to the ASGI app.
+# Requests without a body carry no content-type.
+_ASGI_ACCEPT_HEADERS = ((b"accept", b"application/json, text/event-stream"),)
+_ASGI_STATIC_HEADERS = (
+    *_ASGI_ACCEPT_HEADERS,
+    (b"content-type", b"application/json"),
+)
+
+
+# Request-independent part of the ASGI scope; copied and completed per call.
+_ASGI_SCOPE_TEMPLATE = {
+    "type": "http",
+    "method": "POST",
+    "query_string": b"",
+    "root_path": "",
+    "scheme": "http",
+}
+
+
+# Markers of an auth failure in a response body, matched case-insensitively
+# in one pass over the raw bytes (no lowercased copy of the body).
+_AUTH_FAILURE_RE = re.compile(rb"authentication failed|unauthorized", re.IGNORECASE)
+
+
+def _make_asgi_receive(payload: bytes):
+    """Return an ASGI ``receive`` callable that delivers *payload* once."""
+    request_event = {"type": "http.request", "body": payload, "more_body": False}
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return request_event
+        await asyncio.sleep(3600)
+
+    return receive
+
+
+@functools.lru_cache(maxsize=512)
+def _encode_session_id(session_id: str) -> bytes:
+    """Encode an MCP session id header value; clients reuse the same id."""
+    return session_id.encode("utf-8")
+
 
 class FastMCPProtocol(MCPProtocol):
     """
@@ -96,6 +142,7 @@ class FastMCPProtocol(MCPProtocol):
         transport: Optional[BaseTransport] = None,
         route_path: Optional[str] = None,
         auth: Union[httpx.Auth, str, None] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
         **kwargs,
     ) -> MCPClient:
         """
@@ -106,6 +153,9 @@ class FastMCPProtocol(MCPProtocol):
         :param transport: Optional transport instance.
         :param route_path: Optional route path for the client.
         :param auth: Optional HTTP authentication (httpx.Auth or bearer token string).
+        :param http_client: Optional HTTP client to run the initialize handshake
+            over.  It is left open so the caller can reuse its pooled
+            connections; when omitted a temporary client is used and closed.
         :param kwargs: Additional arguments for the MCPClient.
         :return: An instance of MCPClient.
         :raises ValueError: If the URL is not provided.
@@ -141,7 +191,9 @@ class FastMCPProtocol(MCPProtocol):
         elif auth is not None:
             client_auth = auth  # pass httpx.Auth instance directly
 
-        client = httpx.AsyncClient(base_url=full_url, timeout=10.0, auth=client_auth)
+        client = (
+            http_client if http_client is not None else httpx.AsyncClient(timeout=10.0)
+        )
 
         try:
             init_payload = {
@@ -159,6 +211,7 @@ class FastMCPProtocol(MCPProtocol):
                 full_url,
                 headers=headers,
                 json=init_payload,
+                auth=client_auth,
             )
             logger.debug(f"Initialize response: {init_response.status_code}")
 
@@ -180,13 +233,15 @@ class FastMCPProtocol(MCPProtocol):
                     "method": "notifications/initialized",
                     "params": {},
                 },
+                auth=client_auth,
             )
 
         except httpx.RequestError as e:
             logger.error(f"HTTP error during client initialization: {e}")
             raise RuntimeError(f"Failed to initialize MCP client: {e}") from e
         finally:
-            await client.aclose()
+            if http_client is None:
+                await client.aclose()
 
         return MCPClient(
             session_id=session_id,
@@ -208,86 +263,61 @@ class FastMCPProtocol(MCPProtocol):
         assert self._app is not None, "ASGI app is not initialized"
 
         try:
-            # Parse the message payload
-            payload_dict = json.loads(message.payload.decode("utf-8"))
+            # The payload is already a JSON-RPC document; forward it to the
+            # ASGI app as-is instead of parsing and re-encoding it.
+            payload_bytes = message.payload
+            if not payload_bytes:
+                payload_bytes = b""
+                static_headers = _ASGI_ACCEPT_HEADERS
+            else:
+                static_headers = _ASGI_STATIC_HEADERS
 
             # Build headers list
             headers = [
-                (b"accept", b"application/json, text/event-stream"),
-                (b"content-type", b"application/json"),
+                *static_headers,
                 (
                     b"mcp-session-id",
-                    message.headers.get("Mcp-Session-Id", "default_session_id").encode(
-                        "utf-8"
+                    _encode_session_id(
+                        message.get_header("Mcp-Session-Id", "default_session_id")
                     ),
                 ),
             ]
 
             # Check for Authorization (case-insensitive)
-            auth_value = message.headers.get("Authorization") or message.headers.get(
-                "authorization"
-            )
+            auth_value = message.get_header("Authorization")
             if auth_value:
                 headers.append((b"authorization", auth_value.encode("utf-8")))
 
-            scope = {
-                "type": "http",
-                "method": "POST",
-                "path": message.route_path,
-                "headers": headers,
-                "query_string": b"",
-                "root_path": "",
-                "scheme": "http",
-            }
-
-            payload_bytes = json.dumps(payload_dict).encode("utf-8")
-
-            # Create a receive function for the ASGI app
-            def make_receive(payload: bytes):
-                sent = False
-
-                async def receive():
-                    nonlocal sent
-                    if not sent:
-                        sent = True
-                        return {
-                            "type": "http.request",
-                            "body": payload,
-                            "more_body": False,
-                        }
-                    await asyncio.sleep(3600)
-
-                return receive
+            scope = _ASGI_SCOPE_TEMPLATE.copy()
+            scope["path"] = message.route_path
+            scope["headers"] = headers
 
-            # Prepare response data and completion event
-            response_data = {"status": None, "headers": None, "body": bytearray()}
+            # Collect the response body chunks and join them once at the end.
+            # Only the body is used below, so the start message is not recorded.
+            response_chunks: list[bytes] = []
             response_complete = asyncio.Event()
 
             # Define the send function for the ASGI app
             async def send(resp: dict[str, Any]):
-                if resp["type"] == "http.response.start":
-                    response_data["status"] = resp["status"]
-                    response_data["headers"] = resp.get("headers", [])
-                elif resp["type"] == "http.response.body":
-                    if "body" in resp:
-                        response_data["body"].extend(resp["body"])
+                if resp["type"] == "http.response.body":
+                    chunk = resp.get("body")
+                    if chunk:
+                        response_chunks.append(chunk)
                     if not resp.get("more_body", False):
                         response_complete.set()
 
             # Invoke the ASGI app and wait for the response
-            await self._app(scope, make_receive(payload_bytes), send)
+            await self._app(scope, _make_asgi_receive(payload_bytes), send)
             await response_complete.wait()
 
-            # Extract the payload from the response body
-            body = bytes(response_data["body"]).decode("utf-8").strip()
+            # Work on the raw response bytes; the body is only decoded to
+            # text on the error paths below.
+            body = b"".join(response_chunks).strip()
 
-            if any(
-                keyword in body.lower()
-                for keyword in ["authentication failed", "unauthorized"]
-            ):
+            if _AUTH_FAILURE_RE.search(body):
                 error_message = {
                     "error": "Authentication failed or unauthorized access detected",
-                    "response_body": body,
+                    "response_body": body.decode("utf-8", errors="replace"),
                 }
                 return Message(
                     type="MCPResponse",
@@ -296,16 +326,17 @@ class FastMCPProtocol(MCPProtocol):
                 )
 
             for line in body.splitlines():
-                if line.startswith("data: "):
-                    json_data_str = line.removeprefix("data: ").strip()
-                    payload = json.dumps(json.loads(json_data_str)).encode("utf-8")
+                if line.startswith(b"data: "):
+                    # The SSE data line already holds the JSON-RPC response.
+                    payload = line.removeprefix(b"data: ").strip()
                     break
             else:
                 # This will only execute if no "data: " line is found in the entire body
+                text = body.decode("utf-8", errors="replace")
                 return Message(
                     type="MCPResponse",
                     payload=json.dumps(
-                        {"error": f"Invalid response format, body: {body}"}
+                        {"error": f"Invalid response format, body: {text}"}
                     ).encode("utf-8"),
                     reply_to=message.reply_to,
                 )
@@ -3,7 +3,6 @@
 
 from typing import Any, Callable
 import os
-import json
 
 from agntcy_app_sdk.common.logging_config import get_logger
 from agntcy_app_sdk.semantic.message import Message
@@ -180,11 +179,10 @@ class MCPProtocol:
             SessionMessage -> JSON-RPC -> Transport -> Server
             Server -> Transport -> JSON-RPC -> SessionMessage -> Session
         """
-        # Serialize the MCP message to JSON-RPC format
-        # model_dump with specific options ensures proper serialization
-        msg_dict = session_message.message.model_dump(
+        # Serialize the MCP message to JSON-RPC format in a single pass
+        # (pydantic-core encodes straight to JSON, no intermediate dict)
+        msg_json = session_message.message.model_dump_json(
             by_alias=True,  # Use field aliases for JSON compatibility
-            mode="json",  # JSON serialization mode
             exclude_none=True,  # Omit None values from output
         )
 
@@ -193,7 +191,7 @@ class MCPProtocol:
             recipient=topic,
             message=Message(
                 type=str(types.JSONRPCMessage),
-                payload=json.dumps(msg_dict),
+                payload=msg_json.encode("utf-8"),
             ),
         )
 
@@ -202,8 +200,7 @@ class MCPProtocol:
             raise ValueError("No response received from MCP server")
 
         # Deserialize the response back to MCP format
-        msg = resp.payload.decode()
-        json_rpc_message = types.JSONRPCMessage.model_validate_json(msg)
+        json_rpc_message = types.JSONRPCMessage.model_validate_json(resp.payload)
 
         # Route the response back to the session via the read stream
         await self.read_stream_writer.send(SessionMessage(json_rpc_message))
@@ -282,11 +279,14 @@ class MCPProtocol:
             Incoming Message -> JSON-RPC Parse -> MCP Server -> Response -> JSON-RPC Format
         """
         # Deserialize the incoming JSON-RPC message
-        rpc_message = types.JSONRPCMessage.model_validate_json(message.payload.decode())
+        rpc_message = types.JSONRPCMessage.model_validate_json(message.payload)
 
-        # Create a future to track the response for this request
-        future = asyncio.get_event_loop().create_future()
-        self._response_futures[rpc_message.root.id] = future
+        # Create a future to track the response for this request.  The
+        # dispatch table is keyed by request id so ``reply_method`` resolves
+        # it in O(1); entries are dropped once the request completes.
+        request_id = rpc_message.root.id
+        future = asyncio.get_running_loop().create_future()
+        self._response_futures[request_id] = future
 
         # Route the message to the MCP server via the read stream
         session_message = SessionMessage(rpc_message)
@@ -299,24 +299,21 @@ class MCPProtocol:
             # Serialize the response back to JSON-RPC format
             return Message(
                 type=str(types.JSONRPCMessage),
-                payload=json.dumps(
-                    response.message.model_dump(
-                        by_alias=True,  # Use field aliases
-                        mode="json",  # JSON serialization mode
-                        exclude_none=True,  # Omit None values
-                    )
-                ),
+                payload=response.message.model_dump_json(
+                    by_alias=True,  # Use field aliases
+                    exclude_none=True,  # Omit None values
+                ).encode("utf-8"),
             )
         except asyncio.TimeoutError:
             # Handle timeout - log and raise appropriate error
-            logger.warning(f"Timeout waiting for response for id={rpc_message.root.id}")
-            raise TimeoutError(
-                f"Timeout waiting for response for id={rpc_message.root.id}"
-            )
+            logger.warning(f"Timeout waiting for response for id={request_id}")
+            raise TimeoutError(f"Timeout waiting for response for id={request_id}")
         except Exception as e:
             # Handle other errors with proper logging
             logger.error(f"Error waiting for response: {e}")
             raise e
+        finally:
+            self._response_futures.pop(request_id, None)
 
     def message_translator(self, request: Any) -> Message:
         """
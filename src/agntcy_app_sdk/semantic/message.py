@@ -3,13 +3,55 @@
 
 from typing import Optional
 import json
-import base64
+import binascii
+import sys
+import zlib
+
+# json.dumps builds a new JSONEncoder on every call unless all options are
+# left at their defaults; the compact encoder is created once and reused by
+# the envelope and by the clients that build JSON request payloads.
+compact_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+# Upper bound on the inflated size of a zlib-encoded payload, so a small
+# envelope from a peer cannot expand into an arbitrarily large allocation.
+MAX_DECOMPRESSED_PAYLOAD_SIZE = 64 * 1024 * 1024
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern *value* if it is a plain ``str``; return anything else as-is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Payload types that are encoded as-is (buffers are never copied)
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
+def _payload_to_bytes(payload) -> bytes:
+    """Convert a non-bytes payload to UTF-8 bytes (``str()`` for non-strings)."""
+    if isinstance(payload, str):
+        return payload.encode("utf-8")
+    return str(payload).encode("utf-8")
+
 
 # =============== Message Models ================
 
 
 class Message:
-    """Base message structure for communication between components."""
+    """Base message structure for communication between components.
+
+    ``payload`` is stored as bytes: ``str`` payloads are UTF-8 encoded on
+    construction, so serialization does not re-check them per send.
+    """
+
+    __slots__ = (
+        "type",
+        "payload",
+        "reply_to",
+        "route_path",
+        "method",
+        "headers",
+        "status_code",
+    )
 
     def __init__(
         self,
@@ -22,7 +64,9 @@ class Message:
         status_code: Optional[int] = None,
     ):
         self.type = type
-        self.payload = payload
+        self.payload = (
+            payload if isinstance(payload, _BYTES_LIKE) else _payload_to_bytes(payload)
+        )
         self.reply_to = reply_to
         self.route_path = route_path
         self.method = method
@@ -35,63 +79,137 @@ class Message:
     def __str__(self) -> str:
         return f"Message(type={self.type}, payload={self.payload}, reply_to={self.reply_to}, route_path={self.route_path}, method={self.method}, headers={self.headers}, status_code={self.status_code})"
 
-    def serialize(self) -> bytes:
+    def get_header(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a header by name, ignoring case.
+
+        Args:
+            name: The header name
+            default: Value returned when the header is absent
+
+        Returns:
+            The header value, or ``default``
+        """
+        headers = self.headers
+        # Exact-case hit is the common case and a single dict lookup;
+        # the header dict is small, so a miss falls back to one scan.
+        value = headers.get(name)
+        if value is not None:
+            return value
+        lowered = name.lower()
+        for key, value in headers.items():
+            if key.lower() == lowered:
+                return value
+        return default
+
+    def serialize(self, compress_min_size: Optional[int] = None) -> bytes:
         """
         Serialize the Message object into bytes.
 
+        Args:
+            compress_min_size: If set, payloads of at least this many bytes
+                are zlib-compressed when that makes them smaller.  Off by
+                default, since receivers on older SDK versions cannot read
+                compressed messages.
+
         Returns:
             bytes: The serialized message
         """
-        # Ensure payload is bytes-like
+        # The payload is normalized to bytes in __init__; re-normalize only
+        # if it was reassigned to something else afterwards.
         payload_bytes = self.payload
-        if not isinstance(payload_bytes, bytes):
-            if isinstance(payload_bytes, str):
-                payload_bytes = payload_bytes.encode("utf-8")
-            else:
-                payload_bytes = str(payload_bytes).encode("utf-8")
-
-        # Create a dictionary representation of the Message
-        message_dict = {
-            "type": self.type,
-            "payload": base64.b64encode(payload_bytes).decode("ascii"),
+        if not isinstance(payload_bytes, _BYTES_LIKE):
+            payload_bytes = _payload_to_bytes(payload_bytes)
+
+        encoding = None
+        if compress_min_size is not None and len(payload_bytes) >= compress_min_size:
+            # Level 1 already shrinks JSON several-fold at a fraction of
+            # the cost of the higher levels.
+            compressed = zlib.compress(payload_bytes, 1)
+            if len(compressed) < len(payload_bytes):
+                payload_bytes, encoding = compressed, "zlib"
+
+        # An empty payload skips the encoding entirely.  binascii is the C
+        # codec behind base64.b64encode/b64decode; calling it directly skips
+        # the wrapper and, on decode, the extra ASCII re-encode pass over the
+        # payload string.
+        if payload_bytes:
+            encoded_payload = binascii.b2a_base64(payload_bytes, newline=False)
+        else:
+            encoded_payload = b""
+
+        # Optional fields, built in one literal; unset ones (and empty
+        # headers) are left out rather than added one by one afterwards.
+        optional_fields = {
+            key: value
+            for key, value in (
+                ("route_path", self.route_path),
+                ("method", self.method),
+                ("headers", self.headers or None),
+                ("status_code", self.status_code),
+                ("reply_to", self.reply_to),
+                ("encoding", encoding),
+            )
+            if value is not None
         }
 
-        if self.route_path is not None:
-            message_dict["route_path"] = self.route_path
-        if self.method is not None:
-            message_dict["method"] = self.method
-        if self.headers:
-            message_dict["headers"] = self.headers
-        if self.status_code is not None:
-            message_dict["status_code"] = self.status_code
-        if self.reply_to is not None:
-            message_dict["reply_to"] = self.reply_to
-
-        # Convert dictionary to JSON string and then to bytes
-        return json.dumps(message_dict).encode("utf-8")
+        # The envelope is compact JSON.  Base64 output never needs escaping,
+        # so the payload bytes are spliced in as-is instead of being decoded
+        # to str, run through the JSON encoder and encoded back.  The
+        # encoder output is ASCII (ensure_ascii), so the small fields around
+        # it encode to the same bytes.  The JSON envelope is kept (rather
+        # than a binary framing) because tracing instrumentation reads and
+        # rewrites its "headers" field in flight.
+        head = b'{"type":' + compact_json_encode(self.type).encode("utf-8")
+        if optional_fields:
+            tail = b'",' + compact_json_encode(optional_fields)[1:].encode("utf-8")
+        else:
+            tail = b'"}'
+        return b"".join((head, b',"payload":"', encoded_payload, tail))
 
     @classmethod
-    def deserialize(cls, data: bytes) -> "Message":
+    def deserialize(
+        cls,
+        data: bytes,
+        max_decompressed_size: int = MAX_DECOMPRESSED_PAYLOAD_SIZE,
+    ) -> "Message":
         """
         Deserialize bytes into a Message object.
 
         Args:
             data: The serialized message bytes
+            max_decompressed_size: Largest payload, in bytes, a compressed
+                envelope may inflate to
 
         Returns:
             Message: The deserialized Message object
-        """
-        # Ensure input is bytes
-        if isinstance(data, str):
-            data = data.encode("utf-8")
 
-        # Convert bytes to JSON string and then to dictionary
-        message_dict = json.loads(data.decode("utf-8"))
+        Raises:
+            ValueError: If the payload encoding is unsupported, or a
+                compressed payload is truncated or exceeds
+                ``max_decompressed_size``
+        """
+        # json.loads accepts str and UTF-8 bytes directly, so no
+        # intermediate decode/encode copy is made here.
+        message_dict = json.loads(data)
 
         # Extract required fields
         type_value = message_dict.get("type")
         # Decode the base64-encoded payload
-        payload = base64.b64decode(message_dict["payload"])
+        payload = binascii.a2b_base64(message_dict["payload"])
+        encoding = message_dict.get("encoding")
+        if encoding is not None:
+            if encoding != "zlib":
+                raise ValueError(f"Unsupported payload encoding: {encoding!r}")
+            decompressor = zlib.decompressobj()
+            payload = decompressor.decompress(payload, max_decompressed_size)
+            if decompressor.unconsumed_tail:
+                raise ValueError(
+                    "Compressed payload exceeds "
+                    f"{max_decompressed_size} bytes when decompressed"
+                )
+            if not decompressor.eof:
+                raise ValueError("Compressed payload is truncated")
 
         # Extract optional fields
         reply_to = message_dict.get("reply_to")
@@ -100,13 +218,16 @@ class Message:
         headers = message_dict.get("headers", {})
         status_code = message_dict.get("status_code")
 
-        # Create and return a new Message instance
+        # Create and return a new Message instance.  The message type,
+        # route and method come from a small fixed vocabulary, so they are
+        # interned to share one string object (and compare by identity)
+        # instead of keeping a fresh copy per received message.
         return cls(
-            type=type_value,
+            type=_intern(type_value),
             payload=payload,
             reply_to=reply_to,
-            route_path=route_path,
-            method=method,
+            route_path=_intern(route_path),
+            method=_intern(method),
             headers=headers,
             status_code=status_code,
         )
@@ -2,8 +2,19 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from abc import ABC, abstractmethod
+import inspect
+import weakref
 from agntcy_app_sdk.semantic.message import Message
-from typing import Callable, Awaitable, AsyncIterator, List, Any, TypeVar, Type
+from typing import (
+    Callable,
+    Awaitable,
+    AsyncIterator,
+    List,
+    Any,
+    Optional,
+    TypeVar,
+    Type,
+)
 
 """
 # Transport Mixins: Messaging Patterns & Unified Interface
@@ -165,6 +176,73 @@ class GroupChatMixin(ABC):
 T = TypeVar("T", bound="BaseTransport")
 
 
+# Callback -> whether it accepts ``publish_fn``.  Weak keys, with bound
+# methods keyed on their function, so the cache never keeps a handler or the
+# object it is bound to alive.
+_PUBLISH_FN_SUPPORT: "weakref.WeakKeyDictionary[Any, Optional[bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+_BOUND_PUBLISH_FN_SUPPORT: "weakref.WeakKeyDictionary[Any, Optional[bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _probe_publish_fn(callback: Callable[..., Any]) -> Optional[bool]:
+    try:
+        signature = inspect.signature(callback)
+    except (TypeError, ValueError):
+        return None
+    try:
+        signature.bind(None, publish_fn=None)
+    except TypeError:
+        return False
+    return True
+
+
+def accepts_publish_fn(callback: Callable[..., Any]) -> Optional[bool]:
+    """
+    Return whether *callback* can be called as ``callback(message, publish_fn=...)``.
+
+    ``None`` means the signature cannot be inspected.  The answer is cached
+    per callback so that transports can dispatch each inbound message
+    directly instead of probing the signature on every call.
+    """
+    func = getattr(callback, "__func__", None)
+    if func is not None:
+        cache, key = _BOUND_PUBLISH_FN_SUPPORT, func
+    else:
+        cache, key = _PUBLISH_FN_SUPPORT, callback
+    try:
+        return cache[key]
+    except (KeyError, TypeError):  # TypeError: not weakly referenceable
+        pass
+    result = _probe_publish_fn(callback)
+    try:
+        cache[key] = result
+    except TypeError:
+        pass
+    return result
+
+
+async def invoke_callback(
+    callback: Callable[..., Awaitable[Any]],
+    message: Message,
+    publish_fn: Callable[[Message], Awaitable[None]],
+) -> Any:
+    """Await *callback* for *message*, passing ``publish_fn`` if it takes one."""
+    accepts = accepts_publish_fn(callback)
+    if accepts:
+        return await callback(message, publish_fn=publish_fn)
+    if accepts is None:
+        try:
+            return await callback(message, publish_fn=publish_fn)
+        except TypeError:
+            # Fallback: the signature is opaque and the callback does not
+            # accept publish_fn.  Call without the extra kwarg.
+            pass
+    return await callback(message)
+
+
 class BaseTransport(PointToPointMixin, FanOutMixin, GroupChatMixin, ABC):
     """
     Unified messaging transport interface.
@@ -9,7 +9,7 @@ from identityservice.sdk import IdentityServiceSdk
 from nats.aio.client import Client as NATS
 
 from agntcy_app_sdk.common.auth import is_identity_auth_enabled
-from agntcy_app_sdk.transport.base import BaseTransport
+from agntcy_app_sdk.transport.base import BaseTransport, invoke_callback
 from agntcy_app_sdk.common.logging_config import get_logger
 from agntcy_app_sdk.semantic.message import Message
 from typing import Callable, List, Optional, Any, Awaitable, AsyncIterator
@@ -23,34 +23,61 @@ Nats implementation of BaseTransport.
 
 
 class NatsTransport(BaseTransport):
+    """NATS implementation of :class:`BaseTransport`.
+
+    Each incoming message is handled in its own task, so a slow handler
+    does not hold up the rest of its subject.  As a result, replies to
+    messages on the same subject are not guaranteed to go out in the order
+    the messages arrived.  Pass ``max_concurrent_handlers=1`` to handle one
+    message at a time, in delivery order.
+    """
+
     TRANSPORT_TYPE: str = "NATS"
     """Registry key used by :class:`AgntcyFactory`."""
 
     def __init__(
-        self, client: Optional[NATS] = None, endpoint: Optional[str] = None, **kwargs
+        self,
+        client: Optional[NATS] = None,
+        endpoint: Optional[str] = None,
+        max_concurrent_handlers: int = 256,
+        **kwargs,
     ):
         """
         Initialize the NATS transport with the given endpoint and client.
         :param endpoint: The NATS server endpoint.
         :param client: An optional NATS client instance. If not provided, a new one will be created.
+        :param max_concurrent_handlers: Upper bound on callback invocations running at once.
         """
 
         if not endpoint and not client:
             raise ValueError("Either endpoint or client must be provided")
         if client and not isinstance(client, NATS):
             raise ValueError("Client must be an instance of nats.aio.client.Client")
+        if max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be at least 1")
 
         self._nc = client
         self.endpoint = endpoint
         self._callback = None
         self.subscriptions = []
         self._ephemeral_subs: dict[str, Any] = {}
+        self._tasks: set[asyncio.Task] = set()
+        # Serializes connection attempts so concurrent setup() calls share one
+        self._connect_lock = asyncio.Lock()
 
         # connection options
         self.connect_timeout = kwargs.get("connect_timeout", 5)
         self.reconnect_time_wait = kwargs.get("reconnect_time_wait", 2)
         self.max_reconnect_attempts = kwargs.get("max_reconnect_attempts", 30)
         self.drain_timeout = kwargs.get("drain_timeout", 2)
+        # Payloads of at least this many bytes are compressed on send
+        # (None disables it; every receiver must run a compatible SDK)
+        self.compression_threshold = kwargs.get("compression_threshold")
+        self.max_concurrent_handlers = max_concurrent_handlers
+        self._handler_slots = asyncio.Semaphore(max_concurrent_handlers)
+        # Set while delivery is held back by the handler limit, so the
+        # warning is logged once per episode rather than per message
+        self._handler_limit_reached = False
 
         if os.environ.get("TRACING_ENABLED", "false").lower() == "true":
             logger.debug("NatsTransport initialized with tracing enabled")
@@ -71,7 +98,7 @@ class NatsTransport(BaseTransport):
         Send a message to a single recipient without expecting a response.
         """
         recipient = self.santize_topic(recipient)
-        logger.debug(f"Publishing {message.payload} to topic: {recipient}")
+        logger.debug("Publishing %s to topic: %s", message.payload, recipient)
 
         if self._nc is None:
             raise RuntimeError(
@@ -80,7 +107,7 @@ class NatsTransport(BaseTransport):
 
         await self._nc.publish(
             recipient,
-            message.serialize(),
+            message.serialize(self.compression_threshold),
         )
 
     async def request(
@@ -91,11 +118,14 @@ class NatsTransport(BaseTransport):
         """
         recipient = self.santize_topic(recipient)
         logger.debug(
-            f"Requesting with payload: {message.payload} to topic: {recipient}"
+            "Requesting with payload: %s to topic: %s", message.payload, recipient
         )
 
         response = await self._nc.request(
-            recipient, message.serialize(), timeout=timeout, **kwargs
+            recipient,
+            message.serialize(self.compression_threshold),
+            timeout=timeout,
+            **kwargs,
         )
         return Message.deserialize(response.data) if response else None
 
@@ -195,7 +225,7 @@ class NatsTransport(BaseTransport):
                     logger.error(f"Failed to get access token for agent: {e}")
 
             logger.debug(
-                f"Publishing to: {publish_topic} and receiving from: {reply_topic}"
+                "Publishing to: %s and receiving from: %s", publish_topic, reply_topic
             )
 
             response_queue: asyncio.Queue = asyncio.Queue()
@@ -219,7 +249,7 @@ class NatsTransport(BaseTransport):
                             response_queue.get(), timeout=timeout
                         )
                         received += 1
-                        logger.debug(f"Received {received} response")
+                        logger.debug("Received %s response", received)
                         yield msg
                     except asyncio.TimeoutError:
                         logger.warning(
@@ -249,8 +279,10 @@ class NatsTransport(BaseTransport):
                 logger.error(f"Failed to get access token for agent: {e}")
 
         logger.debug(
-            f"Invite protocol: ephemeral={ephemeral_topic}, "
-            f"reply={reply_topic}, ack={ack_topic}"
+            "Invite protocol: ephemeral=%s, reply=%s, ack=%s",
+            ephemeral_topic,
+            reply_topic,
+            ack_topic,
         )
 
         response_queue: asyncio.Queue = asyncio.Queue()
@@ -271,18 +303,20 @@ class NatsTransport(BaseTransport):
             reply_sub = await self._nc.subscribe(reply_topic, cb=_response_handler)
             ack_sub = await self._nc.subscribe(ack_topic, cb=_ack_handler)
 
-            # Phase 2: Send invites to each recipient's unique name
+            # Phase 2: Send invites to each recipient's unique name.  Every
+            # recipient gets the same invite, so it is serialized once; the
+            # NATS client buffers the publishes and flushes them together.
+            invite_data = Message(
+                type="invite",
+                payload=b"",
+                headers={
+                    "x-nats-invite-type": "invite",
+                    "x-nats-broadcast-topic": ephemeral_topic,
+                    "x-nats-ack-topic": ack_topic,
+                },
+            ).serialize()
             for recipient in recipients:
-                invite = Message(
-                    type="invite",
-                    payload=b"",
-                    headers={
-                        "x-nats-invite-type": "invite",
-                        "x-nats-broadcast-topic": ephemeral_topic,
-                        "x-nats-ack-topic": ack_topic,
-                    },
-                )
-                await self.publish(self.santize_topic(recipient), invite)
+                await self._nc.publish(self.santize_topic(recipient), invite_data)
 
             # Phase 3: Wait for ACKs
             acks_received = 0
@@ -367,9 +401,9 @@ class NatsTransport(BaseTransport):
     # -----------------------------------------------------------------------------
 
     @classmethod
-    def from_client(cls, client: NATS) -> "NatsTransport":
+    def from_client(cls, client: NATS, **kwargs) -> "NatsTransport":
         # Optionally validate client
-        return cls(client=client)
+        return cls(client=client, **kwargs)
 
     @classmethod
     def from_config(cls, endpoint: str, **kwargs) -> "NatsTransport":
@@ -394,33 +428,61 @@ class NatsTransport(BaseTransport):
             await self._connect()
 
     async def _connect(self):
-        """Connect to the NATS server."""
-        if self._nc is not None and self._nc.is_connected:
-            logger.debug("Already connected to NATS server")
-            return
+        """Connect to the NATS server.
 
-        self._nc = await nats.connect(
-            self.endpoint,
-            reconnect_time_wait=self.reconnect_time_wait,  # Time between reconnect attempts
-            max_reconnect_attempts=self.max_reconnect_attempts,  # Retry for 2 minutes before giving up
-            error_cb=self.error_cb,
-            closed_cb=self.closed_cb,
-            disconnected_cb=self.disconnected_cb,
-            reconnected_cb=self.reconnected_cb,
-            connect_timeout=self.connect_timeout,
-            drain_timeout=self.drain_timeout,
-        )
-        logger.debug("Connected to NATS server")
+        Callers that race here (e.g. several clients created at once on a
+        fresh transport) wait for the first connection instead of each
+        opening their own.
+        """
+        async with self._connect_lock:
+            if self._nc is not None and self._nc.is_connected:
+                logger.debug("Already connected to NATS server")
+                return
+
+            self._nc = await nats.connect(
+                self.endpoint,
+                reconnect_time_wait=self.reconnect_time_wait,  # Time between reconnect attempts
+                max_reconnect_attempts=self.max_reconnect_attempts,  # Retry for 2 minutes before giving up
+                error_cb=self.error_cb,
+                closed_cb=self.closed_cb,
+                disconnected_cb=self.disconnected_cb,
+                reconnected_cb=self.reconnected_cb,
+                connect_timeout=self.connect_timeout,
+                drain_timeout=self.drain_timeout,
+            )
+            logger.debug("Connected to NATS server")
 
     async def close(self) -> None:
-        """Close the NATS connection."""
-        # Clean up any lingering ephemeral subscriptions
-        for _topic, sub in self._ephemeral_subs.items():
+        """Close the NATS connection.
+
+        Subscriptions are removed first so no new handlers start, then
+        in-flight handlers get up to ``drain_timeout`` seconds to publish
+        their replies; any still running after that are cancelled.
+        """
+        # Clean up any lingering ephemeral subscriptions, then the long-lived
+        # ones, so nothing new is dispatched while the handlers finish.
+        for sub in [*self._ephemeral_subs.values(), *self.subscriptions]:
             try:
                 await sub.unsubscribe()
             except Exception:
                 pass
         self._ephemeral_subs.clear()
+        self.subscriptions.clear()
+
+        # Let in-flight handlers publish their replies before draining.
+        if self._tasks:
+            _done, pending = await asyncio.wait(
+                set(self._tasks), timeout=self.drain_timeout
+            )
+            if pending:
+                logger.warning(
+                    "Cancelling %s message handler(s) still running after %ss",
+                    len(pending),
+                    self.drain_timeout,
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
         if self._nc:
             try:
@@ -451,7 +513,7 @@ class NatsTransport(BaseTransport):
             sub = await self._nc.subscribe(topic, cb=self._message_handler)
 
             self.subscriptions.append(sub)
-            logger.debug(f"Subscribed to topic: {topic}")
+            logger.debug("Subscribed to topic: %s", topic)
         except Exception as e:
             logger.error(f"Error subscribe to topic '{topic}': {e}")
 
@@ -485,7 +547,13 @@ class NatsTransport(BaseTransport):
         """
         Internal NATS message handler that deserializes the message and invokes the user-defined callback.
         """
-        message = Message.deserialize(nats_msg.data)
+        # The raw bytes are parsed directly (no decode pass); a message that
+        # is not a valid envelope is dropped here, before any dispatch.
+        try:
+            message = Message.deserialize(nats_msg.data)
+        except Exception as e:
+            logger.error(f"Failed to deserialize message: {e}")
+            return
 
         # Add reply_to from NATS message if not in payload
         if nats_msg.reply and not message.reply_to:
@@ -500,22 +568,47 @@ class NatsTransport(BaseTransport):
             await self._handle_teardown(message)
             return
 
-        # Process the message with the registered handler
+        # Process the message with the registered handler in its own task.
+        # nats-py delivers a subscription's messages one at a time, so
+        # awaiting the handler here would hold up every other request on
+        # the same subject until this one has been answered.  Once
+        # ``max_concurrent_handlers`` are running, delivery waits for a free
+        # slot, leaving further messages queued in the NATS client.
         if self._callback:
-            # Build publish_fn for intermediate streaming messages
-            async def _publish_intermediate(intermediate_msg):
-                if message.reply_to:
-                    try:
-                        await self.publish(message.reply_to, intermediate_msg)
-                    except Exception as e:
-                        logger.error(f"Error publishing intermediate message: {e}")
+            if self._handler_slots.locked() and not self._handler_limit_reached:
+                self._handler_limit_reached = True
+                logger.warning(
+                    "%s NATS message handlers are running; delaying delivery "
+                    "until one finishes (the NATS client may report a slow "
+                    "consumer and drop messages if this persists)",
+                    self.max_concurrent_handlers,
+                )
+            await self._handler_slots.acquire()
+            task = asyncio.create_task(self._process_message(message))
+            self._tasks.add(task)
+            task.add_done_callback(self._handler_done)
+
+    def _handler_done(self, task: asyncio.Task) -> None:
+        """Forget a finished handler task and free its concurrency slot."""
+        self._tasks.discard(task)
+        self._handler_slots.release()
+        if self._handler_limit_reached and not self._handler_slots.locked():
+            self._handler_limit_reached = False
+            logger.info("NATS message handlers are below the concurrency limit again")
+
+    async def _process_message(self, message: Message) -> None:
+        """Invoke the user-defined callback and publish its response."""
+
+        # Build publish_fn for intermediate streaming messages
+        async def _publish_intermediate(intermediate_msg):
+            if message.reply_to:
+                try:
+                    await self.publish(message.reply_to, intermediate_msg)
+                except Exception as e:
+                    logger.error(f"Error publishing intermediate message: {e}")
 
-            try:
-                resp = await self._callback(message, publish_fn=_publish_intermediate)
-            except TypeError:
-                # Fallback: callback does not accept publish_fn (e.g. tests
-                # or custom handlers).  Call without the extra kwarg.
-                resp = await self._callback(message)
+        try:
+            resp = await invoke_callback(self._callback, message, _publish_intermediate)
 
             if not resp and message.reply_to:
                 logger.warning("Handler returned no response for message.")
@@ -525,9 +618,12 @@ class NatsTransport(BaseTransport):
                     reply_to=message.reply_to,
                 )
                 await self.publish(message.reply_to, err_msg)
+                return
 
             # publish final response to the reply topic
             await self.publish(message.reply_to, resp)
+        except Exception as e:
+            logger.error(f"Error processing NATS message: {e}")
 
     # Callbacks and error handling
     async def error_cb(self, e):
@@ -540,4 +636,4 @@ class NatsTransport(BaseTransport):
         logger.warning("Disconnected from NATS.")
 
     async def reconnected_cb(self):
-        logger.debug(f"Reconnected to NATS at {self._nc.connected_url.netloc}...")
+        logger.debug("Reconnected to NATS at %s...", self._nc.connected_url.netloc)
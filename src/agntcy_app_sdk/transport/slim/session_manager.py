@@ -54,10 +54,13 @@ class SessionManager:
                 ),
                 remote_name,
             )
-            # Wait for session to be established
-            await point_to_point_session_ctx.completion.wait_async()
 
-            return point_to_point_session_ctx.session
+        # Wait for session to be established.  Point-to-point sessions are
+        # never shared, so the handshake runs outside the lock and
+        # concurrent requests do not queue behind each other's round-trip.
+        await point_to_point_session_ctx.completion.wait_async()
+
+        return point_to_point_session_ctx.session
 
     async def group_broadcast_session(
         self,
@@ -81,10 +84,12 @@ class SessionManager:
         # use the same lock for session creation and lookup
         async with self._lock:
             if session_key in self._sessions:
-                logger.debug(f"Reusing existing group broadcast session: {session_key}")
+                logger.debug(
+                    "Reusing existing group broadcast session: %s", session_key
+                )
                 return session_key, self._sessions[session_key]
 
-            logger.debug(f"Creating new group broadcast session: {session_key}")
+            logger.debug("Creating new group broadcast session: %s", session_key)
             group_session_ctx = await self._slim.create_session_async(
                 SessionConfig(
                     session_type=SessionType.GROUP,
@@ -100,10 +105,11 @@ class SessionManager:
             await group_session_ctx.completion.wait_async()
 
             group_session = group_session_ctx.session
-            for invitee in invitees:
+
+            async def _invite(invitee: Name) -> None:
                 try:
                     logger.debug(
-                        f"Inviting {invitee} to session {group_session.session_id()}"
+                        "Inviting %s to session %s", invitee, group_session.session_id()
                     )
                     await self._slim.set_route_async(invitee, self._slim_connection_id)
                     invite_handle = await group_session.invite_async(invitee)
@@ -111,11 +117,16 @@ class SessionManager:
                         invite_handle.wait_async()
                     )  # guarantee that the invitee is invited to the group successfully
                     logger.debug(
-                        f"Invited {invitee} to session {group_session.session_id()}"
+                        "Invited %s to session %s", invitee, group_session.session_id()
                     )
                 except Exception as e:
                     logger.error(f"Failed to invite {invitee}: {e}")
 
+            # Submit all invites at once and wait for them together, so
+            # setting up the group costs one round-trip rather than one
+            # per invitee.
+            await asyncio.gather(*(_invite(invitee) for invitee in invitees))
+
             # store the session info
             self._sessions[session_key] = group_session
             return session_key, group_session
@@ -135,14 +146,18 @@ class SessionManager:
             # Removing session from local cache must be done before the actual session deletion from SLIM,
             # otherwise it would result in "session already closed" error since SLIM doesn't allow accessing
             # properties on a closed session.
-            logger.debug(f"Attempting to remove session {session_id} from local cache.")
+            logger.debug(
+                "Attempting to remove session %s from local cache.", session_id
+            )
             await self._local_cache_cleanup(session_id)
 
-            logger.debug(f"Attempting to delete session {session_id} from SLIM server.")
+            logger.debug(
+                "Attempting to delete session %s from SLIM server.", session_id
+            )
             delete_session_handle = await self._slim.delete_session_async(session)
             await delete_session_handle.wait_async()
 
-            logger.debug(f"Session {session_id} deleted successfully.")
+            logger.debug("Session %s deleted successfully.", session_id)
         except asyncio.TimeoutError:
             logger.warning(
                 f"Timed out while trying to delete session {session_id}. "
@@ -164,7 +179,7 @@ class SessionManager:
 
             if session_key:
                 del self._sessions[session_key]
-                logger.debug(f"Locally cleaned up session: {session_id}")
+                logger.debug("Locally cleaned up session: %s", session_id)
             else:
                 logger.warning(
                     f"Session {session_id} cannot be removed from "
@@ -177,7 +192,6 @@ class SessionManager:
         """
         session = self._sessions.get(session_key)
         if session:
-            print(dir(session))
             return {
                 "id": session.session_id(),
             }
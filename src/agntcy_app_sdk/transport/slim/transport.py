@@ -14,7 +14,7 @@ from .common import (
     split_id,
 )
 from agntcy_app_sdk.common.logging_config import get_logger
-from agntcy_app_sdk.transport.base import BaseTransport
+from agntcy_app_sdk.transport.base import BaseTransport, invoke_callback
 from agntcy_app_sdk.semantic.message import Message
 from agntcy_app_sdk.transport.slim.session_manager import SessionManager
 
@@ -49,6 +49,8 @@ class SLIMTransport(BaseTransport):
         jwt: str = None,
         bundle: str | None = None,
         audience: list[str] | None = None,
+        max_concurrent_handlers: int = 256,
+        compression_threshold: Optional[int] = None,
     ) -> None:
         if not routable_name:
             raise ValueError(
@@ -86,9 +88,20 @@ class SLIMTransport(BaseTransport):
         self._audience = audience
 
         self._session_manager = SessionManager()
+        # Remote names already routed on this connection (see _ensure_route)
+        self._routes: set[str] = set()
         self._tasks: set[asyncio.Task] = set()
         self._listener_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
+        # Payloads of at least this many bytes are compressed on send
+        # (None disables it; every receiver must run a compatible SDK)
+        self.compression_threshold = compression_threshold
+        # Upper bound on callback invocations running at once, across all
+        # sessions; a session waiting for a slot stops reading until then.
+        self.max_concurrent_handlers = max_concurrent_handlers
+        self._handler_slots = asyncio.Semaphore(max_concurrent_handlers)
+        # Serializes connection attempts so concurrent setup() calls share one
+        self._connect_lock = asyncio.Lock()
 
         self.enable_opentelemetry = False
         if os.environ.get("TRACING_ENABLED", "false").lower() == "true":
@@ -126,9 +139,9 @@ class SLIMTransport(BaseTransport):
             logger.warning("SLIM client is not initialized, calling setup() ...")
             await self.setup()
 
-        logger.debug(f"Requesting response from topic: {remote_name}")
+        logger.debug("Requesting response from topic: %s", remote_name)
 
-        await self._slim_app.set_route_async(remote_name, self._slim_connection_id)
+        await self._ensure_route(remote_name)
 
         # create a point-to-point session
         point_to_point_session = await self._session_manager.point_to_point_session(
@@ -140,24 +153,27 @@ class SLIMTransport(BaseTransport):
         message.headers["x-respond-to-source"] = "true"
 
         try:
-            await point_to_point_session.publish_async(message.serialize(), None, None)
+            await point_to_point_session.publish_async(
+                message.serialize(self.compression_threshold), None, None
+            )
             logger.debug(
-                f"Published message to {remote_name}, now waiting for response."
+                "Published message to %s, now waiting for response.", remote_name
             )
             # Wait for reply from remote peer
             reply = await point_to_point_session.get_message_async(
                 timeout=datetime.timedelta(seconds=timeout)
             )
-            logger.debug(f"Received message back from {remote_name}")
+            logger.debug("Received message back from %s", remote_name)
         except asyncio.TimeoutError:
-            logger.warning(f"Request timed out after {timeout} seconds")
+            logger.warning("Request timed out after %s seconds", timeout)
             return None
         except Exception:
             logger.exception("Failed to publish message in p2p session")
             return None
         finally:
             logger.debug(
-                f"Closing point-to-point session: {point_to_point_session.session_id()} "
+                "Closing point-to-point session: %s ",
+                point_to_point_session.session_id(),
             )
             await self._session_manager.close_session(point_to_point_session)
 
@@ -184,9 +200,9 @@ class SLIMTransport(BaseTransport):
             logger.warning("SLIM client is not initialized, calling setup() ...")
             await self.setup()
 
-        logger.debug(f"request_stream: opening session to {remote_name}")
+        logger.debug("request_stream: opening session to %s", remote_name)
 
-        await self._slim_app.set_route_async(remote_name, self._slim_connection_id)
+        await self._ensure_route(remote_name)
 
         session = await self._session_manager.point_to_point_session(
             remote_name, timeout=datetime.timedelta(seconds=timeout)
@@ -197,9 +213,11 @@ class SLIMTransport(BaseTransport):
         message.headers["x-respond-to-source"] = "true"
 
         try:
-            await session.publish_async(message.serialize(), None, None)
+            await session.publish_async(
+                message.serialize(self.compression_threshold), None, None
+            )
             logger.debug(
-                f"request_stream: published to {remote_name}, waiting for stream."
+                "request_stream: published to %s, waiting for stream.", remote_name
             )
 
             while True:
@@ -207,14 +225,14 @@ class SLIMTransport(BaseTransport):
                     timeout=datetime.timedelta(seconds=timeout)
                 )
                 reply = Message.deserialize(reply_raw.payload)
-                logger.debug(f"request_stream: received message type={reply.type}")
+                logger.debug("request_stream: received message type=%s", reply.type)
                 yield reply
         except asyncio.TimeoutError:
-            logger.warning(f"request_stream timed out after {timeout}s")
+            logger.warning("request_stream timed out after %ss", timeout)
         except Exception:
             logger.exception("Failed in request_stream")
         finally:
-            logger.debug(f"Closing request_stream session: {session.session_id()}")
+            logger.debug("Closing request_stream session: %s", session.session_id())
             await self._session_manager.close_session(session)
 
     # -----------------------------------------------------------------------------
@@ -284,7 +302,9 @@ class SLIMTransport(BaseTransport):
             message_limit = float("inf")
 
         logger.debug(
-            f"Broadcasting to topic: {remote_name} and waiting for {message_limit} responses"
+            "Broadcasting to topic: %s and waiting for %s responses",
+            remote_name,
+            message_limit,
         )
 
         try:
@@ -310,7 +330,9 @@ class SLIMTransport(BaseTransport):
 
                 logger.debug("Publishing message to topic: %s", topic)
 
-                await group_session.publish_async(message.serialize(), None, None)
+                await group_session.publish_async(
+                    message.serialize(self.compression_threshold), None, None
+                )
 
                 logger.debug(
                     "Published message to topic: %s via session %s, now waiting for responses",
@@ -341,7 +363,8 @@ class SLIMTransport(BaseTransport):
         finally:
             if group_session:
                 logger.debug(
-                    f"Closing group session {group_session.session_id()} after gathering responses"
+                    "Closing group session %s after gathering responses",
+                    group_session.session_id(),
                 )
                 await self._session_manager.close_session(group_session)
 
@@ -391,7 +414,7 @@ class SLIMTransport(BaseTransport):
                 "participants list must be provided for SLIM COLLECT_ALL mode."
             )
 
-        logger.debug(f"Requesting group response from topic: {remote_name}")
+        logger.debug("Requesting group response from topic: %s", remote_name)
 
         # Convert recipients to Name objects
         invitees = [self.build_name(recipient) for recipient in participants]
@@ -415,7 +438,9 @@ class SLIMTransport(BaseTransport):
                 await asyncio.sleep(0.5)
 
                 # Initiate the group broadcast
-                await group_session.publish_async(init_message.serialize(), None, None)
+                await group_session.publish_async(
+                    init_message.serialize(self.compression_threshold), None, None
+                )
 
                 # Wait for responses from invitees until the end message is received
                 while True:
@@ -489,10 +514,26 @@ class SLIMTransport(BaseTransport):
         return self.TRANSPORT_TYPE
 
     async def close(self) -> None:
+        # Stop the session listener and every per-session receive loop in
+        # one place, so no task outlives the transport.
+        self._shutdown_event.set()
+        tasks = list(self._tasks)
+        if self._listener_task is not None:
+            tasks.append(self._listener_task)
+            self._listener_task = None
+        current = asyncio.current_task()
+        tasks = [task for task in tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
         if not self._slim_service:
             logger.warning("SLIM client is not initialized, no connection close.")
             return
 
+        # Routes belong to the connection being torn down.
+        self._routes.clear()
+
         # handle slim server disconnection
         try:
             # blocking operation
@@ -512,6 +553,7 @@ class SLIMTransport(BaseTransport):
         # Start the listener task after setting the callback
         if not self._slim_app:
             raise ValueError("SLIM client is not set, please call setup() first.")
+        self._shutdown_event.clear()
         self._listener_task = asyncio.create_task(self._listen_for_sessions())
 
     async def setup(self):
@@ -563,9 +605,10 @@ class SLIMTransport(BaseTransport):
                         timeout=self.message_timeout
                     )
                     logger.debug(
-                        f"Received new session with id: {received_session.session_id()}, "
-                        f"type: {received_session.session_type()}, "
-                        f"destination: {received_session.destination()},"
+                        "Received new session with id: %s, type: %s, destination: %s,",
+                        received_session.session_id(),
+                        received_session.session_type(),
+                        received_session.destination(),
                     )
                     task = asyncio.create_task(
                         self._handle_session_receive(received_session)
@@ -611,7 +654,8 @@ class SLIMTransport(BaseTransport):
                         or "session already closed"
                     ):
                         logger.debug(
-                            f"Session {session_id} closed remotely (likely by moderator), stopping listener"
+                            "Session %s closed remotely (likely by moderator), stopping listener",
+                            session_id,
                         )
                         break
                     else:
@@ -635,10 +679,10 @@ class SLIMTransport(BaseTransport):
                     )
                     await asyncio.sleep(0.5)  # backoff to avoid spin
         except asyncio.CancelledError:
-            logger.debug(f"Session {session_id} handler cancelled")
+            logger.debug("Session %s handler cancelled", session_id)
             raise
         finally:
-            logger.debug(f"Session {session_id} receive loop terminated")
+            logger.debug("Session %s receive loop terminated", session_id)
 
     async def _process_received_message(self, session: Session, msg):
         """Process a single received message and handle response logic."""
@@ -656,24 +700,20 @@ class SLIMTransport(BaseTransport):
         async def _publish_intermediate(intermediate_msg: Message):
             try:
                 await session.publish_to_async(
-                    msg.context, intermediate_msg.serialize(), None, None
+                    msg.context,
+                    intermediate_msg.serialize(self.compression_threshold),
+                    None,
+                    None,
                 )
             except Exception as pub_err:
                 logger.error(f"Error publishing intermediate message: {pub_err}")
 
         # Call the callback function
         try:
-            output = await self._callback(
-                deserialized_msg, publish_fn=_publish_intermediate
-            )
-        except TypeError:
-            # Fallback: callback does not accept publish_fn (e.g. tests
-            # or custom handlers).  Call without the extra kwarg.
-            try:
-                output = await self._callback(deserialized_msg)
-            except Exception as e:
-                logger.error(f"Error in callback function: {e}")
-                return
+            async with self._handler_slots:
+                output = await invoke_callback(
+                    self._callback, deserialized_msg, _publish_intermediate
+                )
         except Exception as e:
             logger.error(f"Error in callback function: {e}")
             return
@@ -692,36 +732,29 @@ class SLIMTransport(BaseTransport):
         session_id = session.session_id()
 
         try:
-            respond_to_source = (
-                original_msg.headers.get("x-respond-to-source", "false").lower()
-                == "true"
-            )
-            respond_to_group = (
-                original_msg.headers.get("x-respond-to-group", "false").lower()
-                == "true"
-            )
+            # Read each routing header from the original message once
+            source_flag = original_msg.headers.get("x-respond-to-source", "false")
+            group_flag = original_msg.headers.get("x-respond-to-group", "false")
+            respond_to_source = source_flag.lower() == "true"
+            respond_to_group = group_flag.lower() == "true"
 
             if not output.headers:
                 output.headers = {}
 
             # propagate relevant headers from the original message if not already set
-            if "x-respond-to-source" not in output.headers:
-                output.headers["x-respond-to-source"] = original_msg.headers.get(
-                    "x-respond-to-source", "false"
-                )
-            if "x-respond-to-group" not in output.headers:
-                output.headers["x-respond-to-group"] = original_msg.headers.get(
-                    "x-respond-to-group", "false"
-                )
+            output.headers.setdefault("x-respond-to-source", source_flag)
+            output.headers.setdefault("x-respond-to-group", group_flag)
 
-            payload = output.serialize()
+            payload = output.serialize(self.compression_threshold)
 
             if respond_to_source:
-                logger.debug(f"Responding to source on channel: {session.source()}")
+                logger.debug("Responding to source on channel: %s", session.source())
                 await session.publish_to_async(msg_ctx, payload, None, None)
             elif respond_to_group:
                 logger.debug(
-                    f"Responding to group on channel: {session.destination()} with payload:\n {output}"
+                    "Responding to group on channel: %s with payload:\n %s",
+                    session.destination(),
+                    output,
                 )
                 await session.publish_async(payload, None, None)
             else:
@@ -740,26 +773,39 @@ class SLIMTransport(BaseTransport):
             else:
                 logger.error(f"Error handling response: {e}")
 
+    async def _ensure_route(self, remote_name: Name) -> None:
+        """Set the route to *remote_name* on this connection once.
+
+        Routes persist for the lifetime of the SLIM connection, so repeat
+        requests to the same peer skip the ``set_route_async`` round-trip.
+        """
+        route_key = str(remote_name)
+        if route_key in self._routes:
+            return
+        await self._slim_app.set_route_async(remote_name, self._slim_connection_id)
+        self._routes.add(route_key)
+
     async def _slim_connect(
         self,
     ) -> None:
-        if self._slim_app:
-            return  # Already connected
-
-        slim_service, slim_app, connection_id = await get_or_create_slim_instance(
-            self.name,
-            slim_endpoint=self._endpoint,
-            slim_insecure_client=self._tls_insecure,
-            enable_opentelemetry=self.enable_opentelemetry,
-            shared_secret=self._shared_secret_identity,
-            jwt=self._jwt,
-            bundle=self._bundle,
-            audience=self._audience,
-        )
-        self._slim_service = slim_service
-        self._slim_app = slim_app
-        self._slim_connection_id = connection_id
-        self._session_manager.set_slim(slim_app, connection_id)
+        async with self._connect_lock:
+            if self._slim_app:
+                return  # Already connected
+
+            slim_service, slim_app, connection_id = await get_or_create_slim_instance(
+                self.name,
+                slim_endpoint=self._endpoint,
+                slim_insecure_client=self._tls_insecure,
+                enable_opentelemetry=self.enable_opentelemetry,
+                shared_secret=self._shared_secret_identity,
+                jwt=self._jwt,
+                bundle=self._bundle,
+                audience=self._audience,
+            )
+            self._slim_service = slim_service
+            self._slim_app = slim_app
+            self._slim_connection_id = connection_id
+            self._session_manager.set_slim(slim_app, connection_id)
 
     def sanitize_topic(self, topic: str) -> str:
         """Sanitize the topic name to ensure it is valid for SLIM."""
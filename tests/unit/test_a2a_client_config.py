@@ -284,6 +284,16 @@ class TestParseTopicFromUrl:
             == "default/default/agent"
         )
 
+    def test_matches_urlparse_for_non_trivial_urls(self):
+        """URLs outside the str fast path fall back to urlparse semantics."""
+        from agntcy_app_sdk.semantic.a2a.client.transports import _parse_topic_from_url
+
+        assert _parse_topic_from_url("slim://user@localhost:46357/agent") == "agent"
+        assert _parse_topic_from_url("nats://my_topic?x=1") == "my_topic"
+        assert _parse_topic_from_url("http://localhost:9999/?q=1") == (
+            "http://localhost:9999/?q=1"
+        )
+
 
 # ---------------------------------------------------------------------------
 # PatternsClientTransport tests
@@ -740,6 +750,136 @@ class TestA2AClientFactory:
         result = await A2AClientFactory.connect(card, config=config)
         assert isinstance(result, Client)
 
+    @pytest.mark.asyncio
+    async def test_resolve_card_reuses_factory_http_client(self, monkeypatch):
+        """resolve_card() should fetch cards over the factory's one client."""
+        from agntcy_app_sdk.semantic.a2a.client import factory as factory_mod
+        from agntcy_app_sdk.semantic.a2a.client.factory import A2AClientFactory
+
+        http_clients = []
+
+        class _FakeResolver:
+            def __init__(self, http_client, base_url):
+                http_clients.append(http_client)
+
+            async def get_agent_card(self):
+                return _make_agent_card()
+
+        monkeypatch.setattr(factory_mod, "A2ACardResolver", _FakeResolver)
+
+        factory = A2AClientFactory()
+        try:
+            await factory.resolve_card("http://localhost:8080")
+            await factory.resolve_card("http://localhost:8081")
+
+            assert len(http_clients) == 2
+            assert http_clients[0] is http_clients[1]
+            assert not http_clients[0].is_closed
+        finally:
+            await factory.aclose()
+
+        assert http_clients[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_connect_closes_its_http_client(self, monkeypatch):
+        """connect() with a URL should not leave an HTTP client open."""
+        from agntcy_app_sdk.semantic.a2a.client import factory as factory_mod
+        from agntcy_app_sdk.semantic.a2a.client.factory import A2AClientFactory
+
+        http_clients = []
+
+        class _FakeResolver:
+            def __init__(self, http_client, base_url):
+                http_clients.append(http_client)
+
+            async def get_agent_card(self):
+                return _make_agent_card()
+
+        monkeypatch.setattr(factory_mod, "A2ACardResolver", _FakeResolver)
+
+        result = await A2AClientFactory.connect("http://localhost:8080")
+
+        assert isinstance(result, Client)
+        assert http_clients[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_resolve_card_caches_until_invalidated(self, monkeypatch):
+        """resolve_card() fetches a URL once until it is invalidated."""
+        from agntcy_app_sdk.semantic.a2a.client import factory as factory_mod
+        from agntcy_app_sdk.semantic.a2a.client.factory import A2AClientFactory
+
+        fetches = []
+
+        class _FakeResolver:
+            def __init__(self, http_client, base_url):
+                self.base_url = base_url
+
+            async def get_agent_card(self):
+                fetches.append(self.base_url)
+                return _make_agent_card(url="")
+
+        monkeypatch.setattr(factory_mod, "A2ACardResolver", _FakeResolver)
+
+        factory = A2AClientFactory()
+        try:
+            first = await factory.resolve_card("http://localhost:8080")
+            second = await factory.resolve_card("http://localhost:8080")
+            assert fetches == ["http://localhost:8080"]
+            assert first == second
+            assert first is not second
+            assert first.url == "http://localhost:8080"
+
+            factory.invalidate_card("http://localhost:8080")
+            await factory.resolve_card("http://localhost:8080")
+            assert len(fetches) == 2
+
+            # Caches are per factory
+            await A2AClientFactory().resolve_card("http://localhost:8080")
+            assert len(fetches) == 3
+        finally:
+            await factory.aclose()
+
+    @pytest.mark.asyncio
+    async def test_resolve_card_cache_is_bounded_and_expires(self, monkeypatch):
+        """The least recently used card is evicted, and entries expire."""
+        from agntcy_app_sdk.semantic.a2a.client import factory as factory_mod
+        from agntcy_app_sdk.semantic.a2a.client.factory import A2AClientFactory
+
+        fetches = []
+
+        class _FakeResolver:
+            def __init__(self, http_client, base_url):
+                self.base_url = base_url
+
+            async def get_agent_card(self):
+                fetches.append(self.base_url)
+                return _make_agent_card()
+
+        monkeypatch.setattr(factory_mod, "A2ACardResolver", _FakeResolver)
+        monkeypatch.setattr(factory_mod, "CARD_CACHE_MAX_SIZE", 2)
+
+        factory = A2AClientFactory()
+        try:
+            await factory.resolve_card("http://a")
+            await factory.resolve_card("http://b")
+            await factory.resolve_card("http://a")  # a is now most recent
+            await factory.resolve_card("http://c")  # evicts b
+            assert list(factory._card_cache) == ["http://a", "http://c"]
+
+            monkeypatch.setattr(factory_mod, "CARD_CACHE_TTL_SECONDS", -1.0)
+            factory.invalidate_card()
+            await factory.resolve_card("http://a")
+            await factory.resolve_card("http://a")  # already expired
+            assert fetches == [
+                "http://a",
+                "http://b",
+                "http://c",
+                "http://a",
+                "http://a",
+            ]
+        finally:
+            await factory.aclose()
+
 
 # ---------------------------------------------------------------------------
 # Multi-transport negotiation tests
@@ -928,6 +1068,21 @@ class TestMultiTransportNegotiation:
         with pytest.raises(ValueError, match="No compatible transports"):
             factory._negotiate(card)
 
+    @pytest.mark.asyncio
+    async def test_create_no_match_raises_before_setup(self, monkeypatch):
+        """create() rejects an incompatible card before any setup work."""
+        factory, config = self._make_multi_transport_factory()
+        tracing = MagicMock()
+        monkeypatch.setattr(factory, "_initialize_tracing_if_enabled", tracing)
+        card = _make_agent_card(preferred_transport="grpc", url="grpc://agent")
+
+        with pytest.raises(ValueError, match="No compatible transports"):
+            await factory.create(card)
+
+        tracing.assert_not_called()
+        config.slim_transport.setup.assert_not_called()
+        config.nats_transport.setup.assert_not_called()
+
     # -- create() dispatches to correct path --------------------------------
 
     @pytest.mark.asyncio
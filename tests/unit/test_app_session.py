@@ -1,6 +1,11 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from agntcy_app_sdk.app_sessions import AppContainer, AppSession
 from agntcy_app_sdk.factory import AgntcyFactory
 from tests.server.a2a_starlette_server import default_a2a_server
 import pytest
@@ -42,3 +47,162 @@ async def test_app_session():
     assert app_session.get_app_container("test_session") is None, (
         "App container was not removed properly."
     )
+
+
+def _make_container(setup) -> AppContainer:
+    """Create an ``AppContainer`` around a stub handler with *setup*."""
+    handler = SimpleNamespace(setup=setup, teardown=AsyncMock())
+    return AppContainer(handler)
+
+
+@pytest.mark.asyncio
+async def test_start_all_sessions_starts_containers_concurrently():
+    """Every container's setup is in flight before any of them finishes."""
+    release = asyncio.Event()
+    both_started = asyncio.Event()
+    started = []
+
+    async def _setup():
+        started.append(True)
+        if len(started) == 2:
+            both_started.set()
+        await release.wait()
+
+    session = AppSession(max_sessions=2)
+    session.add_app_container("a", _make_container(_setup))
+    session.add_app_container("b", _make_container(_setup))
+
+    start = asyncio.create_task(session.start_all_sessions())
+    # Sequential startup would block on the first setup and time out here
+    await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    release.set()
+    await start
+    assert all(c.is_running for c in session.app_containers.values())
+
+
+@pytest.mark.asyncio
+async def test_start_all_sessions_stops_started_containers_on_failure():
+    """A failing container tears down the ones that already started."""
+
+    async def _fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    ok = _make_container(AsyncMock())
+    session = AppSession(max_sessions=2)
+    session.add_app_container("ok", ok)
+    session.add_app_container("bad", _make_container(_fail))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await session.start_all_sessions()
+
+    assert not ok.is_running
+    ok.handler.teardown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_all_sessions_keeps_start_error_when_cleanup_fails():
+    """A teardown error during cleanup does not replace the start error."""
+
+    async def _fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("start failed")
+
+    ok = _make_container(AsyncMock())
+    ok.handler.teardown.side_effect = RuntimeError("teardown failed")
+    session = AppSession(max_sessions=2)
+    session.add_app_container("ok", ok)
+    session.add_app_container("bad", _make_container(_fail))
+
+    with pytest.raises(RuntimeError, match="start failed"):
+        await session.start_all_sessions()
+
+    ok.handler.teardown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_all_sessions_tears_down_container_cancelled_in_directory_setup():
+    """A container cancelled after handler setup, mid directory setup, is torn down."""
+    in_directory_setup = asyncio.Event()
+
+    async def _directory_setup():
+        in_directory_setup.set()
+        await asyncio.Event().wait()
+
+    async def _fail():
+        await in_directory_setup.wait()
+        raise RuntimeError("boom")
+
+    directory = SimpleNamespace(setup=_directory_setup, teardown=AsyncMock())
+    pending = AppContainer(
+        SimpleNamespace(setup=AsyncMock(), teardown=AsyncMock()),
+        directory=directory,
+    )
+    session = AppSession(max_sessions=2)
+    session.add_app_container("pending", pending)
+    session.add_app_container("bad", _make_container(_fail))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await session.start_all_sessions()
+
+    assert not pending.is_running
+    pending.handler.teardown.assert_awaited_once()
+    directory.teardown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stop_all_sessions_stops_containers_concurrently():
+    """Teardowns overlap, and one failure does not skip the others."""
+    release = asyncio.Event()
+    both_stopping = asyncio.Event()
+    stopping = []
+
+    async def _teardown():
+        stopping.append(True)
+        if len(stopping) == 2:
+            both_stopping.set()
+        await release.wait()
+
+    async def _fail():
+        raise RuntimeError("boom")
+
+    slow = _make_container(AsyncMock())
+    slow.handler.teardown = _teardown
+    bad = _make_container(AsyncMock())
+    bad.handler.teardown = _fail
+    other = _make_container(AsyncMock())
+    other.handler.teardown = _teardown
+
+    session = AppSession(max_sessions=3)
+    session.add_app_container("slow", slow)
+    session.add_app_container("bad", bad)
+    session.add_app_container("other", other)
+    await session.start_all_sessions()
+
+    stop = asyncio.create_task(session.stop_all_sessions())
+    # Sequential teardowns would block on the first one and time out here
+    await asyncio.wait_for(both_stopping.wait(), timeout=1)
+
+    release.set()
+    with pytest.raises(RuntimeError, match="boom"):
+        await stop
+    assert not slow.is_running
+    assert not other.is_running
+
+
+@pytest.mark.asyncio
+async def test_stop_releases_loop_forever():
+    """Calling stop() wakes a container parked in loop_forever."""
+    container = _make_container(AsyncMock())
+    await container.run()
+
+    waiter = asyncio.create_task(container.loop_forever())
+    # loop_forever() creates its shutdown event before parking on it
+    while container._shutdown_event is None:
+        await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await container.stop()
+    await asyncio.wait_for(waiter, timeout=1)
+    container.handler.teardown.assert_awaited_once()
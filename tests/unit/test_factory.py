@@ -56,6 +56,17 @@ async def test_base_client_factory_protocol():
     assert factory.fast_mcp().protocol_type() == "FastMCP"
 
 
+@pytest.mark.asyncio
+async def test_stateless_client_factories_are_reused():
+    """Stateless accessors return one instance; A2A builds one per call."""
+    factory = AgntcyFactory()
+
+    assert factory.mcp() is factory.mcp()
+    assert factory.fast_mcp() is factory.fast_mcp()
+    assert factory.a2a() is not factory.a2a()
+    assert AgntcyFactory().mcp() is not factory.mcp()
+
+
 @pytest.mark.asyncio
 async def test_create_transport_unknown_raises():
     """create_transport raises ValueError for an unknown transport type."""
@@ -65,6 +76,37 @@ async def test_create_transport_unknown_raises():
         factory.create_transport("UNKNOWN_TRANSPORT", endpoint="http://localhost:1234")
 
 
+@pytest.mark.asyncio
+async def test_create_transport_passes_nats_handler_limit():
+    """``max_concurrent_handlers`` reaches the NATS transport either way it is built."""
+    from nats.aio.client import Client as NATS
+
+    factory = AgntcyFactory()
+
+    from_endpoint = factory.create_transport(
+        "NATS", endpoint="localhost:4222", max_concurrent_handlers=8
+    )
+    from_client = factory.create_transport(
+        "NATS", client=NATS(), max_concurrent_handlers=8
+    )
+
+    assert from_endpoint.max_concurrent_handlers == 8
+    assert from_client.max_concurrent_handlers == 8
+    with pytest.raises(ValueError, match="max_concurrent_handlers"):
+        factory.create_transport(
+            "NATS", endpoint="localhost:4222", max_concurrent_handlers=0
+        )
+
+
+@pytest.mark.asyncio
+async def test_wellknown_transport_keys_match_classes():
+    """Lazily registered transports are keyed by their ``TRANSPORT_TYPE``."""
+    from agntcy_app_sdk.factory import _WELLKNOWN_TRANSPORTS, _load_transport_class
+
+    for key, path in _WELLKNOWN_TRANSPORTS.items():
+        assert _load_transport_class(path).TRANSPORT_TYPE == key
+
+
 @pytest.mark.asyncio
 async def test_observability_providers_constant():
     """OBSERVABILITY_PROVIDERS class constant is accessible and consistent."""
@@ -206,3 +248,16 @@ async def test_register_custom_directory():
     directory = factory.create_directory("stub", endpoint="custom:9999")
     assert isinstance(directory, StubDirectory)
     assert directory.endpoint == "custom:9999"
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_cached_client_factories():
+    """aclose() releases cached factories; the next accessor call is fresh."""
+    factory = AgntcyFactory()
+    fast_mcp = factory.fast_mcp()
+    http_client = fast_mcp._http_client.get()
+
+    await factory.aclose()
+
+    assert http_client.is_closed
+    assert factory.fast_mcp() is not fast_mcp
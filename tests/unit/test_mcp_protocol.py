@@ -0,0 +1,132 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for the server-side dispatch in ``MCPProtocol.handle_message``."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import mcp.types as types
+import pytest
+from mcp.shared.message import SessionMessage
+
+from agntcy_app_sdk.semantic.fast_mcp.protocol import FastMCPProtocol
+from agntcy_app_sdk.semantic.mcp.protocol import MCPProtocol
+from agntcy_app_sdk.semantic.message import Message
+
+pytest_plugins = "pytest_asyncio"
+
+
+def _make_request(request_id: int) -> Message:
+    payload = {"jsonrpc": "2.0", "id": request_id, "method": "tools/list"}
+    return Message(type="MCPRequest", payload=json.dumps(payload).encode("utf-8"))
+
+
+def _make_protocol(send) -> MCPProtocol:
+    """Create an ``MCPProtocol`` whose server stream is replaced by *send*."""
+    protocol = MCPProtocol()
+    protocol._response_futures = {}
+    protocol.read_stream_writer = SimpleNamespace(send=send)
+    return protocol
+
+
+@pytest.mark.asyncio
+async def test_handle_message_releases_response_future():
+    """The response future is removed once the server has replied."""
+
+    async def _reply(session_message: SessionMessage) -> None:
+        request_id = session_message.message.root.id
+        response = types.JSONRPCMessage(
+            types.JSONRPCResponse(jsonrpc="2.0", id=request_id, result={})
+        )
+        protocol._response_futures[request_id].set_result(SessionMessage(response))
+
+    protocol = _make_protocol(_reply)
+
+    resp = await protocol.handle_message(_make_request(7))
+
+    assert json.loads(resp.payload)["id"] == 7
+    assert protocol._response_futures == {}
+
+
+@pytest.mark.asyncio
+async def test_handle_message_releases_response_future_on_timeout():
+    """A request that times out does not leave its future behind."""
+
+    async def _drop(session_message: SessionMessage) -> None:
+        pass
+
+    protocol = _make_protocol(_drop)
+
+    with pytest.raises(TimeoutError):
+        await protocol.handle_message(_make_request(8), timeout=0.01)
+
+    assert protocol._response_futures == {}
+
+
+def _mock_mcp_server(seen: list) -> httpx.MockTransport:
+    """An MCP endpoint that records (url, authorization) for each request."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.headers.get("authorization")))
+        return httpx.Response(200, headers={"Mcp-Session-Id": "session-1"})
+
+    return httpx.MockTransport(_handler)
+
+
+@pytest.mark.asyncio
+async def test_fast_mcp_create_client_reuses_caller_http_client():
+    """The initialize handshake goes over the caller's client, left open."""
+    seen = []
+    http_client = httpx.AsyncClient(transport=_mock_mcp_server(seen))
+    try:
+        protocol = FastMCPProtocol()
+        first = await protocol.create_client(
+            url="http://localhost:8081/mcp", http_client=http_client
+        )
+        second = await protocol.create_client(
+            url="http://localhost:8081/mcp", auth="token", http_client=http_client
+        )
+
+        assert first.session_id == second.session_id == "session-1"
+        assert not http_client.is_closed
+        # initialize + notifications/initialized per client
+        assert [url for url, _ in seen] == ["http://localhost:8081/mcp"] * 4
+        assert [auth for _, auth in seen] == [
+            None,
+            None,
+            "Bearer token",
+            "Bearer token",
+        ]
+    finally:
+        await http_client.aclose()
+
+
+def test_fast_mcp_client_factory_http_client_follows_event_loop(monkeypatch):
+    """A factory reused across ``asyncio.run`` calls gets a client per loop."""
+    from agntcy_app_sdk.semantic.fast_mcp.client_factory import FastMCPClientFactory
+
+    seen = []
+    transport = _mock_mcp_server(seen)
+    original = httpx.AsyncClient
+
+    def _client(**kwargs):
+        return original(transport=transport, **kwargs)
+
+    monkeypatch.setattr("agntcy_app_sdk.common.http.httpx.AsyncClient", _client)
+    factory = FastMCPClientFactory()
+    clients = []
+
+    async def _run() -> None:
+        await factory.create_client(url="http://localhost:8081/mcp")
+        clients.append(factory._http_client.get())
+
+    asyncio.run(_run())
+    asyncio.run(_run())
+
+    assert len(seen) == 4
+    assert clients[0] is not clients[1]
+
+    asyncio.run(factory.aclose())
@@ -0,0 +1,165 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for :class:`Message` wire serialization."""
+
+import base64
+import json
+
+import pytest
+
+from agntcy_app_sdk.semantic.message import Message
+
+
+def test_serialize_round_trip():
+    """A serialized message deserializes to the same fields."""
+    original = Message(
+        type="request",
+        payload=b"\x00\xffbinary payload",
+        reply_to="reply_topic",
+        route_path="/mcp",
+        headers={"Mcp-Session-Id": "abc"},
+        status_code=200,
+    )
+
+    restored = Message.deserialize(original.serialize())
+
+    assert restored.type == original.type
+    assert restored.payload == original.payload
+    assert restored.reply_to == original.reply_to
+    assert restored.route_path == original.route_path
+    assert restored.method == original.method
+    assert restored.headers == original.headers
+    assert restored.status_code == original.status_code
+
+
+def test_serialize_is_compact_json():
+    """The envelope stays JSON (tracing relies on it) without padding."""
+    data = Message(type="request", payload=b"ping").serialize()
+
+    assert b", " not in data and b": " not in data
+    envelope = json.loads(data)
+    assert base64.b64decode(envelope["payload"]) == b"ping"
+
+
+def test_serialize_matches_json_encoder():
+    """The hand-assembled envelope is byte-identical to encoding the dict."""
+    message = Message(
+        type='req"uest\u00e9',
+        payload=b"\x00\xffbinary",
+        reply_to="reply_topic",
+        headers={"traceparent": "00-abc"},
+        status_code=0,
+    )
+    expected = {
+        "type": message.type,
+        "payload": base64.b64encode(message.payload).decode("ascii"),
+        "route_path": "/",
+        "method": "POST",
+        "headers": message.headers,
+        "status_code": 0,
+        "reply_to": "reply_topic",
+    }
+
+    assert message.serialize() == json.dumps(expected, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def test_deserialize_accepts_str_and_spaced_json():
+    """Envelopes produced with default json.dumps spacing still decode."""
+    envelope = json.dumps(
+        {"type": "request", "payload": base64.b64encode(b"ping").decode("ascii")}
+    )
+
+    assert Message.deserialize(envelope).payload == b"ping"
+    assert Message.deserialize(envelope.encode("utf-8")).payload == b"ping"
+
+
+def test_serialize_accepts_buffer_payloads():
+    """bytearray and memoryview payloads are encoded as their raw bytes."""
+    for payload in (bytearray(b"ping"), memoryview(b"ping")):
+        data = Message(type="request", payload=payload).serialize()
+
+        assert Message.deserialize(data).payload == b"ping"
+
+
+def test_message_has_no_instance_dict():
+    """Messages use slots, so unknown attributes cannot be set."""
+    message = Message(type="request", payload=b"ping")
+
+    assert not hasattr(message, "__dict__")
+    with pytest.raises(AttributeError):
+        message.unknown = True
+
+
+def test_get_header_ignores_case():
+    """Header lookups match regardless of the sender's key casing."""
+    message = Message(
+        type="request", payload=b"", headers={"authorization": "Bearer t"}
+    )
+
+    assert message.get_header("Authorization") == "Bearer t"
+    assert message.get_header("AUTHORIZATION") == "Bearer t"
+    assert message.get_header("Mcp-Session-Id") is None
+    assert message.get_header("Mcp-Session-Id", "default") == "default"
+
+
+def test_serialize_empty_payload():
+    """An empty payload is sent as an empty field and decodes to b""."""
+    for payload in (b"", ""):
+        data = Message(type="request", payload=payload).serialize()
+
+        assert json.loads(data)["payload"] == ""
+        assert Message.deserialize(data).payload == b""
+
+
+def test_str_payload_is_stored_as_bytes():
+    """A ``str`` payload is UTF-8 encoded once, when the message is built."""
+    message = Message(type="request", payload='{"ok": "é"}')
+
+    assert message.payload == '{"ok": "é"}'.encode("utf-8")
+    assert Message.deserialize(message.serialize()).payload == message.payload
+
+
+def test_serialize_compresses_large_payloads():
+    """Payloads over the threshold are compressed and restored on decode."""
+    payload = b'{"text": "' + b"a" * 4096 + b'"}'
+    message = Message(type="request", payload=payload)
+
+    plain = message.serialize()
+    compressed = message.serialize(compress_min_size=1024)
+
+    assert "encoding" not in json.loads(plain)
+    assert json.loads(compressed)["encoding"] == "zlib"
+    assert len(compressed) < len(plain)
+    assert Message.deserialize(compressed).payload == payload
+
+
+def test_serialize_skips_compression_below_threshold():
+    """Small payloads are sent as-is even when compression is enabled."""
+    data = Message(type="request", payload=b"ping").serialize(compress_min_size=1024)
+
+    assert "encoding" not in json.loads(data)
+    assert Message.deserialize(data).payload == b"ping"
+
+
+def test_deserialize_rejects_unknown_encoding():
+    """A payload encoding this SDK cannot decode is an error, not garbage."""
+    envelope = json.dumps({"type": "request", "payload": "", "encoding": "br"})
+
+    with pytest.raises(ValueError, match="Unsupported payload encoding"):
+        Message.deserialize(envelope)
+
+
+def test_deserialize_rejects_oversized_compressed_payload():
+    """A compressed payload that inflates past the limit is refused."""
+    data = Message(type="request", payload=b"\x00" * 65536).serialize(
+        compress_min_size=1
+    )
+
+    assert Message.deserialize(data, max_decompressed_size=65536).payload == (
+        b"\x00" * 65536
+    )
+    with pytest.raises(ValueError, match="exceeds 1024 bytes"):
+        Message.deserialize(data, max_decompressed_size=1024)
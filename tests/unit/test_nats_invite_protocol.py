@@ -9,12 +9,16 @@ to each recipient's unique name, waits for ACKs, then publishes the real
 message on an ephemeral topic.
 """
 
+import asyncio
+import gc
+import weakref
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from agntcy_app_sdk.semantic.message import Message
+from agntcy_app_sdk.transport.base import accepts_publish_fn, invoke_callback
 from agntcy_app_sdk.transport.nats.transport import NatsTransport
 
 pytest_plugins = "pytest_asyncio"
@@ -40,6 +44,13 @@ def _make_transport(nc_mock: AsyncMock) -> NatsTransport:
     transport._callback = None
     transport.subscriptions = []
     transport._ephemeral_subs = {}
+    transport._tasks = set()
+    transport._connect_lock = asyncio.Lock()
+    transport.max_concurrent_handlers = 256
+    transport._handler_slots = asyncio.Semaphore(256)
+    transport._handler_limit_reached = False
+    transport.compression_threshold = None
+    transport.drain_timeout = 2
     return transport
 
 
@@ -214,6 +225,7 @@ async def test_message_handler_passes_normal_messages():
     nats_msg = _make_nats_msg(normal_msg)
 
     await transport._message_handler(nats_msg)
+    await asyncio.gather(*transport._tasks)
 
     transport._callback.assert_awaited_once()
     # The response should be published to the reply_to topic
@@ -221,6 +233,178 @@ async def test_message_handler_passes_normal_messages():
     assert nc.publish.call_args[0][0] == "reply_topic"
 
 
+@pytest.mark.asyncio
+async def test_message_handler_drops_malformed_messages():
+    """Data that is not a valid envelope never reaches the callback."""
+    nc = _make_nc_mock()
+    transport = _make_transport(nc)
+    transport._callback = AsyncMock()
+
+    for data in (b"not json", b'{"type": "request"}', b'{"payload": "abc"}'):
+        await transport._message_handler(SimpleNamespace(data=data, reply=""))
+
+    assert transport._tasks == set()
+    transport._callback.assert_not_called()
+    nc.publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_message_handler_does_not_block_on_callback():
+    """A slow handler must not hold up delivery of the next message."""
+    nc = _make_nc_mock()
+    transport = _make_transport(nc)
+
+    release = asyncio.Event()
+    seen: list[bytes] = []
+
+    async def _callback(message, publish_fn=None):
+        seen.append(message.payload)
+        await release.wait()
+        return Message(type="response", payload=message.payload)
+
+    transport._callback = _callback
+
+    for payload in (b"first", b"second"):
+        msg = Message(type="request", payload=payload, reply_to="reply_topic")
+        await transport._message_handler(_make_nats_msg(msg))
+
+    # Both handlers are running even though neither has returned yet.
+    await asyncio.sleep(0)
+    assert seen == [b"first", b"second"]
+    nc.publish.assert_not_called()
+
+    release.set()
+    await asyncio.gather(*transport._tasks)
+    assert nc.publish.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_message_handler_bounds_concurrent_handlers():
+    """Delivery waits for a free slot once the handler limit is reached."""
+    nc = _make_nc_mock()
+    transport = _make_transport(nc)
+    transport.max_concurrent_handlers = 1
+    transport._handler_slots = asyncio.Semaphore(1)
+
+    release = asyncio.Event()
+
+    async def _callback(message, publish_fn=None):
+        await release.wait()
+        return Message(type="response", payload=message.payload)
+
+    transport._callback = _callback
+
+    first = Message(type="request", payload=b"first", reply_to="reply_topic")
+    second = Message(type="request", payload=b"second", reply_to="reply_topic")
+    with patch("agntcy_app_sdk.transport.nats.transport.logger") as logger:
+        await transport._message_handler(_make_nats_msg(first))
+        pending = asyncio.create_task(
+            transport._message_handler(_make_nats_msg(second))
+        )
+
+        await asyncio.sleep(0)
+        assert not pending.done()
+        assert len(transport._tasks) == 1
+        # Hitting the limit is reported, since NATS may start dropping messages
+        logger.warning.assert_called_once()
+
+        release.set()
+        await pending
+        await asyncio.gather(*transport._tasks)
+    assert nc.publish.call_count == 2
+    # The done callback that frees the last slot also clears the flag
+    while transport._tasks:
+        await asyncio.sleep(0)
+    assert not transport._handler_limit_reached
+
+
+@pytest.mark.asyncio
+async def test_message_handler_calls_plain_callback_once():
+    """A callback without ``publish_fn`` is invoked once, not retried."""
+    nc = _make_nc_mock()
+    transport = _make_transport(nc)
+
+    calls = []
+
+    async def _callback(message):
+        calls.append(message.payload)
+        raise TypeError("handler bug")
+
+    transport._callback = _callback
+
+    msg = Message(type="request", payload=b"data", reply_to="reply_topic")
+    await transport._message_handler(_make_nats_msg(msg))
+    await asyncio.gather(*transport._tasks)
+
+    assert calls == [b"data"]
+
+
+@pytest.mark.asyncio
+async def test_invoke_callback_matches_call_signature():
+    """publish_fn is passed only when the callback can bind it."""
+    publish_fn = AsyncMock()
+    msg = Message(type="request", payload=b"data")
+
+    async def _with_publish_fn(message, publish_fn):
+        return "publish_fn"
+
+    async def _with_kwargs(message, **kwargs):
+        return sorted(kwargs)
+
+    async def _plain(message):
+        return "plain"
+
+    async def _kwargs_only(**kwargs):
+        return "unreachable"
+
+    assert await invoke_callback(_with_publish_fn, msg, publish_fn) == "publish_fn"
+    assert await invoke_callback(_with_kwargs, msg, publish_fn) == ["publish_fn"]
+    assert await invoke_callback(_plain, msg, publish_fn) == "plain"
+    assert accepts_publish_fn(_kwargs_only) is False
+    with pytest.raises(TypeError):
+        await invoke_callback(_kwargs_only, msg, publish_fn)
+
+
+@pytest.mark.asyncio
+async def test_invoke_callback_falls_back_for_opaque_signatures():
+    """Callbacks whose signature cannot be inspected keep the TypeError fallback."""
+
+    class _Opaque:
+        __signature__ = "not a signature"
+
+        def __init__(self):
+            self.calls = []
+
+        async def __call__(self, message, **kwargs):
+            self.calls.append(kwargs)
+            if kwargs:
+                raise TypeError("unexpected keyword argument 'publish_fn'")
+            return "plain"
+
+    callback = _Opaque()
+    msg = Message(type="request", payload=b"data")
+
+    assert accepts_publish_fn(callback) is None
+    assert await invoke_callback(callback, msg, AsyncMock()) == "plain"
+    assert len(callback.calls) == 2
+
+
+def test_accepts_publish_fn_does_not_keep_bound_owner_alive():
+    """The signature cache does not hold a reference to a handler's owner."""
+
+    class _Handler:
+        async def handle(self, message, publish_fn=None):
+            return None
+
+    handler = _Handler()
+    assert accepts_publish_fn(handler.handle) is True
+    owner = weakref.ref(handler)
+    del handler
+    gc.collect()
+
+    assert owner() is None
+
+
 # ---------------------------------------------------------------------------
 # gather_stream — single-recipient guard
 # ---------------------------------------------------------------------------
@@ -361,6 +545,31 @@ async def test_gather_stream_multi_recipient_uses_invite():
     assert len(teardown_publishes) == 1
 
 
+# ---------------------------------------------------------------------------
+# setup() — connection
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_concurrent_setup_opens_one_connection():
+    """Concurrent ``setup()`` calls on a fresh transport share one connection."""
+    nc = _make_nc_mock()
+
+    async def _fake_connect(*args, **kwargs):
+        await asyncio.sleep(0)
+        return nc
+
+    transport = NatsTransport(endpoint="nats://localhost:4222")
+    with patch(
+        "agntcy_app_sdk.transport.nats.transport.nats.connect",
+        AsyncMock(side_effect=_fake_connect),
+    ) as connect:
+        await asyncio.gather(*(transport.setup() for _ in range(3)))
+
+    connect.assert_awaited_once()
+    assert transport._nc is nc
+
+
 # ---------------------------------------------------------------------------
 # close() — ephemeral subscription cleanup
 # ---------------------------------------------------------------------------
@@ -383,3 +592,43 @@ async def test_close_cleans_up_ephemeral_subs():
     assert transport._ephemeral_subs == {}
     nc.drain.assert_awaited_once()
     nc.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_close_unsubscribes_before_waiting_on_handlers():
+    """``close()`` stops delivery first, then waits for in-flight handlers."""
+    nc = _make_nc_mock()
+    transport = _make_transport(nc)
+    sub = AsyncMock()
+    transport.subscriptions = [sub]
+
+    finished = asyncio.Event()
+
+    async def _handler():
+        # Delivery must already be stopped while handlers are drained
+        sub.unsubscribe.assert_awaited_once()
+        finished.set()
+
+    transport._tasks.add(asyncio.create_task(_handler()))
+
+    await transport.close()
+
+    assert finished.is_set()
+    assert transport.subscriptions == []
+    nc.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_handlers_still_running_after_drain_timeout():
+    """Handlers outliving ``drain_timeout`` are cancelled before the close."""
+    nc = _make_nc_mock()
+    transport = _make_transport(nc)
+    transport.drain_timeout = 0
+
+    stuck = asyncio.create_task(asyncio.Event().wait())
+    transport._tasks.add(stuck)
+
+    await transport.close()
+
+    assert stuck.cancelled()
+    nc.close.assert_awaited_once()